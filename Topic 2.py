@@ -1,11 +1,355 @@
 import tkinter as tk
 from tkinter import messagebox
 from tkinter import ttk
+from tkinter import filedialog
+from array import array
+from collections import deque
+import csv
+import io
+import itertools
+import os
 import re
+import sys
+import tempfile
+import threading
+import time
+
+from priority_queue import IndexedPriorityQueue
+from table_view import VirtualTable
+
+# Compiled once and shared by the form and the CSV import
+PHONE_PATTERN = re.compile(r"^(078|079)\d{7}$")
+NAME_PATTERN = re.compile(r"^[^\W\d_][\w .'-]*$")
+
+
+def validate_request_row(username, phone, request):
+    """Return None if the row is valid, otherwise the reason it was rejected."""
+    if not username or not phone or not request:
+        return "Missing field"
+    if not NAME_PATTERN.match(username):
+        return "Invalid username"
+    if not PHONE_PATTERN.match(phone):
+        return "Phone number must be 10 digits and start with 078 or 079"
+    return None
+
+
+class ImportReport:
+    """Outcome of a bulk CSV import: counts, rejected rows and throughput."""
+    def __init__(self):
+        self.accepted = 0
+        self.errors = []  # (line number, raw row, reason)
+        self.elapsed = 0.0
+
+    @property
+    def rejected(self):
+        return len(self.errors)
+
+    @property
+    def rows_per_sec(self):
+        total = self.accepted + self.rejected
+        return total / self.elapsed if self.elapsed else 0.0
+
+    def write_errors(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["line", "row", "reason"])
+            for line, row, reason in self.errors:
+                # Re-encode the row with csv quoting so fields holding commas or quotes survive
+                raw = io.StringIO()
+                csv.writer(raw, lineterminator="").writerow(row)
+                writer.writerow([line, raw.getvalue(), reason])
+
+    def summary(self):
+        return (f"Imported {self.accepted} requests, rejected {self.rejected} "
+                f"in {self.elapsed:.2f}s ({self.rows_per_sec:,.0f} rows/sec).")
+
+
+def import_requests_csv(path, queue, chunk_size=5000):
+    """Stream a CSV of username, phone, request rows into the queue in chunks.
+
+    A header row is skipped if present. Valid rows of each chunk are added
+    with a single enqueue_many call; invalid rows are collected in the report.
+    """
+    report = ImportReport()
+    start = time.perf_counter()
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        rows = enumerate(csv.reader(file), start=1)
+        first = next(rows, None)
+        is_header = first is not None and first[1][:1] and first[1][0].strip().lower() in ("username", "name")
+        if first is not None and not is_header:
+            rows = itertools.chain([first], rows)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            valid = []
+            for line, row in chunk:
+                if len(row) != 3:
+                    report.errors.append((line, row, "Expected 3 columns"))
+                    continue
+                username, phone, request = (field.strip() for field in row)
+                reason = validate_request_row(username, phone, request)
+                if reason:
+                    report.errors.append((line, row, reason))
+                else:
+                    valid.append((line, (username, phone, request)))
+            added = queue.enqueue_many(item for _, item in valid)
+            report.accepted += added
+            for line, item in valid[added:]:
+                report.errors.append((line, list(item), "Queue full"))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+class RequestQueue:
+    """Headless FIFO queue of client requests with O(1) enqueue and dequeue."""
+    def __init__(self, capacity=None):
+        self.capacity = capacity  # None means unbounded
+        self.items = deque()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def is_empty(self):
+        return not self.items
+
+    def is_full(self):
+        return self.capacity is not None and len(self.items) >= self.capacity
+
+    def enqueue(self, item):
+        """Add a request at the rear. Returns False if the queue is full."""
+        if self.is_full():
+            return False
+        self.items.append(item)
+        return True
+
+    def dequeue(self):
+        """Remove and return the request at the front, or None if empty."""
+        if not self.items:
+            return None
+        return self.items.popleft()
+
+    def peek(self):
+        return self.items[0] if self.items else None
+
+    def enqueue_many(self, items):
+        """Add several requests at once. Returns how many were accepted."""
+        if self.capacity is None:
+            before = len(self.items)
+            self.items.extend(items)
+            return len(self.items) - before
+        added = 0
+        for item in items:
+            if not self.enqueue(item):
+                break
+            added += 1
+        return added
+
+    def dequeue_many(self, count):
+        """Remove and return up to `count` requests from the front."""
+        count = min(count, len(self.items))
+        popleft = self.items.popleft
+        return [popleft() for _ in range(count)]
+
+    def clear(self):
+        self.items.clear()
+
+
+class CircularRequestQueue:
+    """Array-backed ring buffer of client requests.
+
+    Fields are kept in parallel columns (username, phone, request) so each
+    slot costs a fixed amount of memory; phones (always 10 digits) are
+    stored as integers.
+    When the buffer is full it doubles up to `max_capacity`, after which the
+    overflow policy decides what happens:
+        "reject"    - refuse the new request
+        "overwrite" - drop the oldest request to make room
+        "block"     - wait until a consumer frees a slot
+    When mostly empty it halves again, never below the initial capacity.
+    """
+    POLICIES = ("reject", "overwrite", "block")
+
+    def __init__(self, capacity=5, max_capacity=None, policy="reject"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.min_capacity = capacity
+        self.max_capacity = capacity if max_capacity is None else max_capacity
+        self.policy = policy
+        self.dropped = 0  # requests lost to the "overwrite" policy
+        self.not_full = threading.Condition()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.size = capacity
+        self.usernames = [None] * capacity
+        self.phones = array("q", bytes(8 * capacity))
+        self.requests = [None] * capacity
+        self.front = self.rear = -1
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        i = self.front
+        for _ in range(self.count):
+            yield self._read(i)
+            i = (i + 1) % self.size
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError("queue index out of range")
+        return self._read((self.front + index) % self.size)
+
+    @property
+    def capacity(self):
+        return self.size
+
+    def is_empty(self):
+        return self.front == -1
+
+    def is_full(self):
+        return (self.rear + 1) % self.size == self.front and self.size >= self.max_capacity
+
+    def _read(self, i):
+        return (self.usernames[i], f"{self.phones[i]:010d}", self.requests[i])
+
+    def _write(self, i, item):
+        username, phone, request = item
+        self.phones[i] = int(phone)
+        self.usernames[i] = username
+        self.requests[i] = request
+
+    def _resize(self, capacity):
+        """Copy the queued requests, oldest first, into a buffer of a new size."""
+        items = list(self)
+        self._allocate(capacity)
+        for item in items:
+            self._push(item)
+
+    def _push(self, item):
+        rear = 0 if self.front == -1 else (self.rear + 1) % self.size
+        self._write(rear, item)  # Before moving the indexes, so a bad item leaves the ring as it was
+        if self.front == -1:
+            self.front = 0
+        self.rear = rear
+        self.count += 1
+
+    def enqueue(self, item, timeout=None):
+        """Add a request at the rear. Returns False if it was not accepted.
+
+        Raises ValueError for a phone that is not exactly 10 digits (the
+        column keeps it as an integer, so leading zeros are restored on read),
+        before anything is evicted to make room.
+        """
+        phone = str(item[1])
+        if not (phone.isdecimal() and len(phone) == 10):
+            raise ValueError(f"Phone number must be exactly 10 digits: {item[1]!r}")
+        with self.not_full:
+            if (self.rear + 1) % self.size == self.front:
+                if self.size < self.max_capacity:
+                    self._resize(min(self.size * 2, self.max_capacity))
+                elif self.policy == "overwrite":
+                    self._pop()
+                    self.dropped += 1
+                elif self.policy == "block":
+                    if not self.not_full.wait_for(lambda: self.count < self.size, timeout):
+                        return False
+                else:
+                    return False
+            self._push(item)
+            return True
+
+    def _pop(self):
+        item = self._read(self.front)
+        self.usernames[self.front] = self.requests[self.front] = None
+        if self.front == self.rear:
+            self.front = self.rear = -1
+        else:
+            self.front = (self.front + 1) % self.size
+        self.count -= 1
+        return item
+
+    def dequeue(self):
+        """Remove and return the request at the front, or None if empty."""
+        with self.not_full:
+            if self.front == -1:
+                return None
+            item = self._pop()
+            if self.size > self.min_capacity and self.count <= self.size // 4:
+                self._resize(max(self.size // 2, self.min_capacity))
+            self.not_full.notify()
+            return item
+
+    def peek(self):
+        return None if self.front == -1 else self._read(self.front)
+
+    def enqueue_many(self, items):
+        """Add several requests at once. Returns how many were accepted."""
+        added = 0
+        for item in items:
+            if not self.enqueue(item):
+                break
+            added += 1
+        return added
+
+    def dequeue_many(self, count):
+        """Remove and return up to `count` requests from the front."""
+        result = []
+        while len(result) < count:
+            item = self.dequeue()
+            if item is None:
+                break
+            result.append(item)
+        return result
+
+    def clear(self):
+        with self.not_full:
+            self._allocate(self.min_capacity)
+            self.not_full.notify_all()
+
+
+class PriorityRequestQueue(IndexedPriorityQueue):
+    """Indexed priority queue with the same interface as RequestQueue.
+
+    enqueue returns the request id, which change_priority and cancel take.
+    """
+    def is_empty(self):
+        return not self.heap
+
+    def is_full(self):
+        return False
+
+    def enqueue(self, item, priority=IndexedPriorityQueue.NORMAL):
+        return self.push(item, priority)
+
+    def dequeue(self):
+        """Remove and return the most urgent request, or None if empty."""
+        return self.pop()[1] if self.heap else None
+
+    def enqueue_many(self, items, priority=IndexedPriorityQueue.NORMAL):
+        added = 0
+        for item in items:
+            self.push(item, priority)
+            added += 1
+        return added
+
+    def dequeue_many(self, count):
+        count = min(count, len(self.heap))
+        return [self.pop()[1] for _ in range(count)]
+
 
 class QueueApp:
-    def __init__(self, root):
+    def __init__(self, root, priority=False):
         self.root = root
+        self.priority = priority  # Serve urgent requests first instead of strict FIFO
         self.root.title("Queue Management System")
         
         # Maximize to full screen
@@ -13,7 +357,7 @@ class QueueApp:
         self.root.config(bg="#f4f4f4")
 
         # Creating the Queue
-        self.queue = []
+        self.queue = self.create_queue()
 
         # Title Label with bigger font
         self.title_label = tk.Label(self.root, text="Real Estate Queue Management", font=("Arial", 24, "bold"), bg="#f4f4f4")
@@ -48,6 +392,20 @@ class QueueApp:
         self.view_button = tk.Button(self.root, text="View Queue", font=("Arial", 18, "bold"), bg="#2196F3", fg="white", command=self.view_queue)
         self.view_button.grid(row=6, column=0, columnspan=2, pady=15, padx=20, sticky="ew")
 
+        self.import_button = tk.Button(self.root, text="Import CSV", font=("Arial", 18, "bold"), bg="#9C27B0", fg="white", command=self.import_csv)
+        self.import_button.grid(row=8, column=0, columnspan=2, pady=15, padx=20, sticky="ew")
+
+        if self.priority:
+            self.priority_combo = ttk.Combobox(self.root, values=list(IndexedPriorityQueue.LEVELS), state="readonly", font=("Arial", 16), width=10)
+            self.priority_combo.set("Normal")
+            self.priority_combo.grid(row=3, column=2, padx=20, pady=10)
+
+            self.cancel_button = tk.Button(self.root, text="Cancel Selected", font=("Arial", 14, "bold"), bg="#795548", fg="white", command=self.cancel_selected)
+            self.cancel_button.grid(row=4, column=2, pady=15, padx=20, sticky="ew")
+
+            self.reprioritize_button = tk.Button(self.root, text="Set Priority", font=("Arial", 14, "bold"), bg="#FF9800", fg="white", command=self.reprioritize_selected)
+            self.reprioritize_button.grid(row=5, column=2, pady=15, padx=20, sticky="ew")
+
         # Table to display the Queue (using Treeview) with larger font size
         self.tree = ttk.Treeview(self.root, columns=("Username", "Phone", "Request"), show="headings", height=10)
         self.tree.heading("Username", text="Username")
@@ -57,14 +415,23 @@ class QueueApp:
         self.tree.column("Phone", anchor="center", width=150)
         self.tree.column("Request", anchor="w", width=300)
         self.tree.grid(row=7, column=0, columnspan=2, pady=20, padx=20, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.tree.yview)
+        self.scrollbar.grid(row=7, column=2, pady=20, sticky="ns")
+
+        # Rows are keyed by enqueue sequence number so the table can follow the queue
+        self.table = VirtualTable(self.tree, scrollbar=self.scrollbar)
+        self.front_key = self.next_key = 0
 
         # Configure row and column weights to make the UI responsive
         self.root.grid_rowconfigure(7, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
 
+    def create_queue(self):
+        return PriorityRequestQueue() if self.priority else RequestQueue()
+
     def validate_phone(self, phone_number):
         """Validate the phone number to check if it's 10 digits and starts with 078 or 079."""
-        if re.match(r"^(078|079)\d{7}$", phone_number):
+        if PHONE_PATTERN.match(phone_number):
             return True
         else:
             messagebox.showwarning("Invalid Phone", "Phone number must be 10 digits and start with 078 or 079.")
@@ -77,7 +444,13 @@ class QueueApp:
 
         if username and phone and request:
             if self.validate_phone(phone):
-                self.queue.append((username, phone, request))
+                if self.priority:
+                    level = IndexedPriorityQueue.LEVELS[self.priority_combo.get()]
+                    request_id = self.queue.enqueue((username, phone, request), level)
+                    self.table.append(request_id, (username, phone, request))
+                else:
+                    self.queue.enqueue((username, phone, request))
+                    self.sync_table((username, phone, request))
                 self.username_entry.delete(0, tk.END)
                 self.phone_entry.delete(0, tk.END)
                 self.entry.delete(0, tk.END)
@@ -89,37 +462,110 @@ class QueueApp:
         else:
             messagebox.showwarning("Input Error", "Please fill in all fields.")
 
+    def import_csv(self):
+        path = filedialog.askopenfilename(title="Import Client Requests", filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        report = import_requests_csv(path, self.queue)
+        if not self.priority:
+            # Imported rows get keys like single enqueues; with the overwrite
+            # policy they may also have pushed older requests out of the front
+            self.next_key += report.accepted
+            self.sync_table()
+        if self.table.active and not self.queue.is_empty():
+            self.view_queue()
+
+        summary = report.summary()
+        if report.errors:
+            error_path = path.rsplit(".", 1)[0] + "_errors.csv"
+            report.write_errors(error_path)
+            summary += f"\nRejected rows written to {error_path}"
+        self.update_output(summary)
+
     def dequeue(self):
-        if self.queue:
-            processed_item = self.queue.pop(0)
+        if self.priority and not self.queue.is_empty():
+            request_id, processed_item = self.queue.pop()
+            self.table.remove(request_id)
+            self.update_output(f"Processed: {processed_item[2]}")
+        elif not self.queue.is_empty():
+            processed_item = self.queue.dequeue()
+            self.sync_table()
             self.update_output(f"Processed: {processed_item[2]}")
         else:
             messagebox.showwarning("Queue Empty", "No requests to process.")
 
     def view_queue(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        
-        if self.queue:
-            for item in self.queue:
-                self.tree.insert("", "end", values=item)
+        if self.priority and not self.queue.is_empty():
+            self.table.load(self.queue.ordered())
+        elif not self.queue.is_empty():
+            self.table.load(self.queued_rows(self.next_key))
         else:
+            self.table.clear()
             self.update_output("Queue is empty.")
 
+    def selected_request_ids(self):
+        return [int(iid) for iid in self.tree.selection()]
+
+    def cancel_selected(self):
+        request_ids = [request_id for request_id in self.selected_request_ids() if request_id in self.queue]
+        if not request_ids:
+            messagebox.showwarning("No Selection", "Select a queued request to cancel.")
+            return
+        for request_id in request_ids:
+            self.queue.cancel(request_id)
+            self.table.remove(request_id)
+        self.update_output(f"Cancelled {len(request_ids)} request(s).")
+
+    def reprioritize_selected(self):
+        request_ids = [request_id for request_id in self.selected_request_ids() if request_id in self.queue]
+        if not request_ids:
+            messagebox.showwarning("No Selection", "Select a queued request to change.")
+            return
+        level = IndexedPriorityQueue.LEVELS[self.priority_combo.get()]
+        for request_id in request_ids:
+            self.queue.change_priority(request_id, level)
+        self.view_queue()
+
+    def queued_rows(self, end_key):
+        """Yield (key, request) pairs up to end_key, reading each request only when paged in."""
+        key = self.front_key
+        while True:
+            key = max(key, self.front_key)  # Skip requests processed since loading
+            if key >= end_key:
+                return
+            yield key, self.queue[key - self.front_key]
+            key += 1
+
+    def sync_table(self, added_item=None):
+        """Apply the latest enqueue/dequeue to the table instead of rebuilding it."""
+        if added_item is not None:
+            self.table.append(self.next_key, added_item)
+            self.next_key += 1
+        # Requests leave from the front, whether processed or overwritten;
+        # queued_rows already steps over them, so only shown or appended rows need dropping
+        while self.next_key - self.front_key > len(self.queue):
+            self.table.forget(self.front_key)
+            self.front_key += 1
+
     def update_output(self, text):
         """Displays a message in the output display."""
         messagebox.showinfo("Queue Update", text)
 
 # Circular Queue Class Implementation
 class CircularQueueApp(QueueApp):
-    def __init__(self, root, size=5):
-        super().__init__(root)
+    def __init__(self, root, size=5, max_size=None, policy="reject"):
         self.size = size
-        self.queue = [None] * self.size
-        self.front = self.rear = -1
+        self.max_size = max_size  # Let the buffer double up to this many requests
+        self.policy = policy
+        super().__init__(root, priority=False)
 
         self.title_label.config(text="Circular Queue Management")
 
+    def create_queue(self):
+        # The GUI thread must never wait on a full queue
+        policy = "reject" if self.policy == "block" else self.policy
+        return CircularRequestQueue(self.size, self.max_size, policy)
+
     def enqueue(self):
         username = self.username_entry.get()
         phone = self.phone_entry.get()
@@ -127,55 +573,88 @@ class CircularQueueApp(QueueApp):
 
         if username and phone and request:
             if self.validate_phone(phone):
-                if (self.rear + 1) % self.size == self.front:
+                # Let the queue apply its overflow policy instead of refusing whenever it is full
+                dropped = self.queue.dropped
+                if not self.queue.enqueue((username, phone, request)):
                     messagebox.showwarning("Queue Full", "Queue is full, cannot add more requests.")
-                elif self.front == -1:
-                    self.front = self.rear = 0
-                    self.queue[self.rear] = (username, phone, request)
-                    self.username_entry.delete(0, tk.END)
-                    self.phone_entry.delete(0, tk.END)
-                    self.entry.delete(0, tk.END)
-                    self.update_output(f"Added to Queue: {request}")
                 else:
-                    self.rear = (self.rear + 1) % self.size
-                    self.queue[self.rear] = (username, phone, request)
+                    self.sync_table((username, phone, request))
                     self.username_entry.delete(0, tk.END)
                     self.phone_entry.delete(0, tk.END)
                     self.entry.delete(0, tk.END)
-                    self.update_output(f"Added to Queue: {request}")
+                    if self.queue.dropped > dropped:
+                        self.update_output(f"Added to Queue: {request}\nThe oldest request was dropped to make room.")
+                    else:
+                        self.update_output(f"Added to Queue: {request}")
         else:
             messagebox.showwarning("Input Error", "Please fill in all fields.")
 
-    def dequeue(self):
-        if self.front == -1:
-            messagebox.showwarning("Queue Empty", "No requests to process.")
-        elif self.front == self.rear:
-            processed_item = self.queue[self.front]
-            self.front = self.rear = -1
-            self.update_output(f"Processed: {processed_item[2]}")
-        else:
-            processed_item = self.queue[self.front]
-            self.front = (self.front + 1) % self.size
-            self.update_output(f"Processed: {processed_item[2]}")
 
-    def view_queue(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        
-        if self.front != -1:
-            i = self.front
-            while i != self.rear:
-                self.tree.insert("", "end", values=self.queue[i])
-                i = (i + 1) % self.size
-            self.tree.insert("", "end", values=self.queue[self.rear])
-        else:
-            self.update_output("Queue is empty.")
+def benchmark_queue(count=100_000):
+    """Load-test the headless request queue without opening a window."""
+    queue = RequestQueue()
+    requests = [("client", "0780000000", f"request {i}") for i in range(count)]
+
+    start = time.perf_counter()
+    for item in requests:
+        queue.enqueue(item)
+    while not queue.is_empty():
+        queue.dequeue()
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    queue.enqueue_many(requests)
+    while queue.dequeue_many(1000):
+        pass
+    bulk = time.perf_counter() - start
+
+    print(f"{count} requests one at a time: {single:.3f}s")
+    print(f"{count} requests in bulk:       {bulk:.3f}s")
+
+    ring = CircularRequestQueue(capacity=1024, max_capacity=count)
+    start = time.perf_counter()
+    ring.enqueue_many(requests)
+    while ring.dequeue_many(1000):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"{count} requests via ring buffer: {elapsed:.3f}s")
+
+    urgent = PriorityRequestQueue()
+    start = time.perf_counter()
+    ids = [urgent.enqueue(item, i % 4) for i, item in enumerate(requests)]
+    for request_id in ids[::10]:
+        urgent.change_priority(request_id, IndexedPriorityQueue.URGENT)
+    for request_id in ids[1::10]:
+        urgent.cancel(request_id)
+    while not urgent.is_empty():
+        urgent.dequeue()
+    elapsed = time.perf_counter() - start
+    print(f"{count} requests via priority queue (with updates and cancels): {elapsed:.3f}s")
+
+def benchmark_import(count=100_000):
+    """Measure CSV import throughput with a mix of valid and invalid rows."""
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="", delete=False) as file:
+        writer = csv.writer(file)
+        writer.writerow(["username", "phone", "request"])
+        for i in range(count):
+            phone = f"078{i % 10_000_000:07d}" if i % 10 else "0123"
+            writer.writerow([f"client{i}", phone, f"request {i}"])
+    try:
+        report = import_requests_csv(file.name, RequestQueue())
+    finally:
+        os.remove(file.name)
+    print(report.summary())
+
 
 # Main Program to Run the Queue Management System
 def run_queue_app():
     root = tk.Tk()
-    app = CircularQueueApp(root)  # To use Circular Queue, change this to QueueApp for normal Queue
+    app = CircularQueueApp(root)  # To use Circular Queue, change this to QueueApp for normal Queue (QueueApp(root, priority=True) serves urgent requests first)
     root.mainloop()
 
 if __name__ == "__main__":
-    run_queue_app()
+    if "--benchmark" in sys.argv:
+        benchmark_queue()
+        benchmark_import()
+    else:
+        run_queue_app()
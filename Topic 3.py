@@ -1,10 +1,463 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from collections import deque
+import gc
+import mmap
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from priority_queue import IndexedPriorityQueue
+
+PRIORITY_NAMES = {level: name for name, level in IndexedPriorityQueue.LEVELS.items()}
+JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "inquiries.journal")
+
+
+class InquiryJournal:
+    """Append-only write-ahead log of inquiry queue events.
+
+    Each event is one line: "E\tname\tphone\tproperty" for an enqueue, "P"
+    for finishing the oldest inquiry and "C" for clearing the queue. In
+    priority mode enqueues also carry "\tpriority\tid", and "R\tid" removes
+    (finishes or cancels) and "U\tid\tpriority" reprioritizes one inquiry.
+    An inquiry is only logged as finished once its handler is done, so
+    one that was being handled during a crash is recovered again.
+    Writes are buffered and fsynced in groups (every `batch_size` events or
+    `sync_interval` seconds). Once the log holds many dead events it is
+    compacted: rewritten atomically as a snapshot of the live queue.
+    """
+    ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n"}
+    UNESCAPES = {"\\\\": "\\", "\\t": "\t", "\\n": "\n"}
+    UNESCAPE_PATTERN = re.compile(r"\\[\\tn]")
+
+    def __init__(self, path=JOURNAL_PATH, batch_size=256, sync_interval=0.2, compact_min=10_000):
+        self.path = path
+        self.batch_size = batch_size
+        self.sync_interval = sync_interval
+        self.compact_min = compact_min
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.records = 0  # Events currently in the log file
+        self.file = None
+
+    def _escape(self, field):
+        for char, escaped in self.ESCAPES.items():
+            field = field.replace(char, escaped)
+        return field
+
+    def _unescape(self, field):
+        return self.UNESCAPE_PATTERN.sub(lambda m: self.UNESCAPES[m.group()], field)
+
+    def recover(self):
+        """Replay the log and return the pending inquiries, oldest first.
+
+        Only the events after the last clear matter, and the first P of
+        those enqueues were already processed, so only survivors are decoded.
+        """
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            self.records = 0
+            return []
+        with open(self.path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = data.rfind(b"\n") + 1  # A torn final write has no newline
+            cleared = data.rfind(b"\nC\n", 0, end)
+            if cleared != -1:
+                start = cleared + 3
+            else:
+                start = 2 if data[:2] == b"C\n" else 0
+            text = data[start:end].decode("utf-8")
+            self.records = data[:end].count(b"\n")
+            torn = end < len(data)
+        if torn:
+            # Drop the partial record so new events do not get appended to it
+            with open(self.path, "r+b") as file:
+                file.truncate(end)
+        lines = text.split("\n")
+        lines.pop()  # Empty string after the final newline
+        # Match R/U only at line starts: a field may end in "R" or "U" before its tab
+        if text[:2] in ("R\t", "U\t") or "\nR\t" in text or "\nU\t" in text:
+            inquiries = self._replay(lines)
+        else:
+            enqueued = [line for line in lines if line[:1] == "E"]
+            processed = len(lines) - len(enqueued)
+
+            # Building many small dicts triggers needless cyclic GC passes
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                rows = [line[2:].split("\t") for line in enqueued[processed:]]
+                inquiries = [{"name": row[0], "phone": row[1], "property": row[2]} for row in rows]
+                if rows and len(rows[0]) == 5:
+                    for inquiry, row in zip(inquiries, rows):
+                        inquiry["priority"] = int(row[3])
+                        inquiry["id"] = int(row[4])
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+        if "\\" in text:
+            for inquiry in inquiries:
+                for key in ("name", "phone", "property"):
+                    inquiry[key] = self._unescape(inquiry[key])
+        return inquiries
+
+    def _replay(self, lines):
+        """Apply events one by one; needed once inquiries leave out of order."""
+        live = {}  # Insertion ordered: request id (or line number) -> inquiry
+        for number, line in enumerate(lines):
+            kind = line[:1]
+            if kind == "E":
+                fields = line[2:].split("\t")
+                inquiry = {"name": fields[0], "phone": fields[1], "property": fields[2]}
+                if len(fields) == 5:
+                    inquiry["priority"] = int(fields[3])
+                    inquiry["id"] = int(fields[4])
+                live[inquiry.get("id", ("line", number))] = inquiry
+            elif kind == "P" and live:
+                del live[next(iter(live))]
+            elif kind == "R":
+                live.pop(int(line[2:]), None)
+            elif kind == "U":
+                request_id, priority = (int(field) for field in line[2:].split("\t"))
+                if request_id in live:
+                    live[request_id]["priority"] = priority
+        return list(live.values())
+
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, "ab", buffering=1 << 16)
+
+    def _append(self, line):
+        self.open()
+        self.file.write(line)
+        self.records += 1
+        self.unsynced += 1
+        if self.unsynced >= self.batch_size or time.monotonic() - self.last_sync >= self.sync_interval:
+            self.sync()
+
+    def _encode(self, inquiry):
+        fields = [self._escape(inquiry[key]) for key in ("name", "phone", "property")]
+        if "id" in inquiry:
+            fields += [str(inquiry["priority"]), str(inquiry["id"])]
+        return ("E\t" + "\t".join(fields) + "\n").encode("utf-8")
+
+    def record_enqueue(self, inquiry):
+        self._append(self._encode(inquiry))
+
+    def record_process(self):
+        self._append(b"P\n")
+
+    def record_remove(self, request_id):
+        self._append(f"R\t{request_id}\n".encode("ascii"))
+
+    def record_priority(self, request_id, priority):
+        self._append(f"U\t{request_id}\t{priority}\n".encode("ascii"))
+
+    def record_clear(self):
+        self._append(b"C\n")
+
+    def sync(self):
+        """Flush buffered events and fsync them as one group commit."""
+        if self.file is not None and self.unsynced:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def needs_compaction(self, live_count):
+        """True once dead events outnumber live inquiries."""
+        return self.records >= self.compact_min and self.records > 2 * live_count
+
+    def compact(self, live_inquiries):
+        """Atomically replace the log with a snapshot of the live inquiries, given oldest first."""
+        self.sync()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as snapshot:
+            snapshot.writelines(self._encode(inquiry) for inquiry in live_inquiries)
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        os.replace(temp_path, self.path)
+        self.records = len(live_inquiries)
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+
+def handle_inquiry(inquiry):
+    """Default work done by a service worker for one inquiry.
+
+    Module-level so it can also be sent to worker processes.
+    """
+    return f"Processed inquiry for {inquiry['name']} (Property: {inquiry['property']})"
+
+
+class InquiryService:
+    """Thread-safe, deque-based inquiry queue with an optional worker pool.
+
+    Any number of producer threads may submit inquiries. With workers=0
+    inquiries are only processed on demand (the Process Inquiry button);
+    otherwise `workers` threads take inquiries and run `handler` on them,
+    in a process pool when use_processes is set. An inquiry whose handler
+    raises is counted as failed, with the error stored under "error", and
+    the worker moves on. A monitor such as the Tk window calls watch() to
+    collect processed inquiries.
+
+    With priority=True the queue is an indexed heap: urgent inquiries are
+    served first (FIFO among equals) and each inquiry gets an "id" that
+    cancel and change_priority take.
+    """
+    def __init__(self, handler=handle_inquiry, workers=0, use_processes=False, journal=None, priority=False):
+        self.handler = handler
+        self.workers = workers
+        self.use_processes = use_processes
+        self.journal = journal
+        self.priority = priority
+        self.inquiry_queue = IndexedPriorityQueue() if priority else deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.completed = None  # Only kept once a monitor is watching
+        self.processed = 0
+        self.failed = 0  # Inquiries whose handler raised; the worker keeps serving
+        self.in_flight = 0
+        # Taken inquiries not yet logged as finished, as [inquiry, finished];
+        # the deque keeps FIFO take order, which P records must follow
+        self.unfinished = deque()
+        self.unfinished_entries = {}  # id(inquiry) -> its entry
+        self.started_at = time.monotonic()
+        self.threads = []
+        self.executor = None
+        self.stopping = False
+        self.drain = True
+
+    def __len__(self):
+        return len(self.inquiry_queue)
+
+    def recover(self):
+        """Reload pending inquiries from the journal, if there is one."""
+        if self.journal is None:
+            return []
+        inquiries = self.journal.recover()
+        with self.lock:
+            if self.priority:
+                missing_ids = False
+                for inquiry in inquiries:
+                    missing_ids = missing_ids or "id" not in inquiry
+                    inquiry.setdefault("priority", IndexedPriorityQueue.NORMAL)
+                    inquiry["id"] = self.inquiry_queue.push(inquiry, inquiry["priority"], inquiry.get("id"))
+                if missing_ids:
+                    # Records from a FIFO run carry no id, so later R/U records could
+                    # not name them; rewrite the log with the ids assigned here
+                    self.journal.compact(self._live_inquiries_locked())
+            else:
+                self.inquiry_queue.extend(inquiries)
+        self.journal.open()
+        return inquiries
+
+    def watch(self):
+        """Return a deque that receives every inquiry processed from now on."""
+        with self.lock:
+            if self.completed is None:
+                self.completed = deque()
+            return self.completed
+
+    def _append_locked(self, inquiry):
+        if self.priority:
+            inquiry.setdefault("priority", IndexedPriorityQueue.NORMAL)
+            inquiry["id"] = self.inquiry_queue.push(inquiry, inquiry["priority"])
+        else:
+            self.inquiry_queue.append(inquiry)
+        if self.journal is not None:
+            self.journal.record_enqueue(inquiry)
+
+    def submit(self, inquiry):
+        with self.not_empty:
+            self._append_locked(inquiry)
+            self.not_empty.notify()
+
+    def submit_many(self, inquiries):
+        with self.not_empty:
+            for inquiry in inquiries:
+                self._append_locked(inquiry)
+            self.not_empty.notify_all()
+
+    def _pop_locked(self):
+        self.in_flight += 1
+        if self.priority:
+            _, inquiry = self.inquiry_queue.pop()
+        else:
+            inquiry = self.inquiry_queue.popleft()
+        if self.journal is not None:
+            # Logged as finished in task_done, so a crash mid-handler replays it
+            entry = [inquiry, False]
+            self.unfinished_entries[id(inquiry)] = entry
+            if not self.priority:
+                self.unfinished.append(entry)
+        return inquiry
+
+    def _log_finished_locked(self, inquiry):
+        entry = self.unfinished_entries.pop(id(inquiry))
+        if self.priority:
+            self.journal.record_remove(inquiry["id"])
+            return
+        # A P record removes the oldest enqueue, so finishes are logged in take order
+        entry[1] = True
+        while self.unfinished and self.unfinished[0][1]:
+            self.unfinished.popleft()
+            self.journal.record_process()
+
+    def _unfinished_locked(self):
+        """Taken inquiries the journal still counts as live, oldest first."""
+        if self.priority:
+            return sorted((entry[0] for entry in self.unfinished_entries.values()), key=lambda inquiry: inquiry["id"])
+        return [entry[0] for entry in self.unfinished]
+
+    def _live_inquiries_locked(self):
+        """Unfinished then queued inquiries, oldest first, for a journal snapshot.
+
+        A priority queue is listed in arrival order, not service order, so
+        recovery re-pushes its inquiries with sequence numbers that keep
+        equal priorities first in, first out.
+        """
+        queued = self.inquiry_queue.arrival_order() if self.priority else list(self.inquiry_queue)
+        return self._unfinished_locked() + queued
+
+    def cancel(self, request_id):
+        """Withdraw a queued inquiry by id (priority mode). Returns it, or None if not queued."""
+        with self.lock:
+            if request_id not in self.inquiry_queue:
+                return None
+            inquiry = self.inquiry_queue.cancel(request_id)
+            if self.journal is not None:
+                self.journal.record_remove(request_id)
+            return inquiry
+
+    def change_priority(self, request_id, priority):
+        """Reprioritize a queued inquiry by id (priority mode). Returns False if not queued."""
+        with self.lock:
+            if request_id not in self.inquiry_queue:
+                return False
+            self.inquiry_queue.change_priority(request_id, priority)
+            self.inquiry_queue.get(request_id)["priority"] = priority
+            if self.journal is not None:
+                self.journal.record_priority(request_id, priority)
+            return True
+
+    def take_nowait(self):
+        """Take the oldest inquiry, or None if the queue is empty."""
+        with self.lock:
+            if not self.inquiry_queue:
+                return None
+            return self._pop_locked()
+
+    def take(self):
+        """Block until an inquiry is available; None once shutting down."""
+        with self.not_empty:
+            while not self.inquiry_queue or (self.stopping and not self.drain):
+                if self.stopping:
+                    return None
+                self.not_empty.wait()
+            return self._pop_locked()
+
+    def task_done(self, inquiry, error=None):
+        with self.lock:
+            self.in_flight -= 1
+            if error is None:
+                self.processed += 1
+            else:
+                self.failed += 1
+                inquiry["error"] = repr(error)
+            if self.completed is not None:
+                self.completed.append(inquiry)
+            if self.journal is not None:
+                self._log_finished_locked(inquiry)
+                unfinished = len(self.unfinished_entries) if self.priority else len(self.unfinished)
+                if self.journal.needs_compaction(len(self.inquiry_queue) + unfinished):
+                    self.journal.compact(self._live_inquiries_locked())
+
+    def clear(self):
+        with self.lock:
+            if self.journal is not None:
+                self.journal.record_clear()
+                # Inquiries being handled survive the clear until they finish
+                for inquiry in self._unfinished_locked():
+                    self.journal.record_enqueue(inquiry)
+            self.inquiry_queue.clear()
+
+    def sync(self):
+        if self.journal is not None:
+            with self.lock:
+                self.journal.sync()
+
+    def start(self):
+        if self.workers and not self.threads:
+            if self.use_processes:
+                self.executor = ProcessPoolExecutor(self.workers)
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"inquiry-worker-{i}", daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def _work(self):
+        while True:
+            inquiry = self.take()
+            if inquiry is None:
+                return
+            try:
+                if self.executor is not None:
+                    self.executor.submit(self.handler, inquiry).result()
+                else:
+                    self.handler(inquiry)
+            except Exception as error:
+                # One bad inquiry must not take a worker out of the pool
+                self.task_done(inquiry, error)
+            else:
+                self.task_done(inquiry)
+
+    def shutdown(self, drain=False, timeout=None):
+        """Stop the workers after their in-flight inquiries finish.
+
+        With drain=True the workers first empty the whole queue; otherwise
+        anything still queued stays in the journal for the next start.
+        """
+        with self.not_empty:
+            self.stopping = True
+            self.drain = drain
+            self.not_empty.notify_all()
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.journal is not None:
+            with self.lock:
+                self.journal.close()
+
+    def stats(self):
+        with self.lock:
+            elapsed = time.monotonic() - self.started_at
+            return {
+                "depth": len(self.inquiry_queue),
+                "in_flight": self.in_flight,
+                "processed": self.processed,
+                "failed": self.failed,
+                "throughput": self.processed / elapsed if elapsed else 0.0,
+            }
 
 
 class RealEstateApp:
-    def __init__(self, root):
+    POLL_INTERVAL = 200  # ms between monitor refreshes and journal group commits
+
+    def __init__(self, root, service=None):
         self.root = root
         self.root.title("Real Estate Property Management (Queue-Based)")
         self.root.configure(bg="#F8F9FA")
@@ -13,11 +466,21 @@ class RealEstateApp:
         self.root.state("zoomed")  # For Windows
 
         # Data Structure
-        self.inquiry_queue = deque()  # Queue to manage inquiries
+        # The window monitors the service; by default it is the only consumer
+        self.service = service if service is not None else InquiryService(journal=InquiryJournal())
+        self.inquiry_items = {}  # Treeview item id -> queued inquiry
 
         # UI Elements
         self.create_ui()
 
+        # Restore inquiries that were still pending when the app last closed
+        for inquiry in self.service.recover():
+            self.show_inquiry(inquiry)
+        self.completed = self.service.watch()
+        self.service.start()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(self.POLL_INTERVAL, self.poll_service)
+
     def create_ui(self):
         # Fonts
         title_font = ("Arial", 16, "bold")
@@ -40,17 +503,27 @@ class RealEstateApp:
         self.property_entry = ttk.Entry(input_frame)
         self.property_entry.grid(row=2, column=1, padx=10, pady=5)
 
+        if self.service.priority:
+            tk.Label(input_frame, text="Priority:", font=label_font, bg="#E9ECEF").grid(row=3, column=0, padx=10, pady=5, sticky="w")
+            self.priority_combo = ttk.Combobox(input_frame, values=list(IndexedPriorityQueue.LEVELS), state="readonly")
+            self.priority_combo.set("Normal")
+            self.priority_combo.grid(row=3, column=1, padx=10, pady=5)
+
         add_button = tk.Button(input_frame, text="Add Inquiry", font=button_font, bg="#28A745", fg="white", command=self.add_inquiry)
-        add_button.grid(row=3, column=0, columnspan=2, pady=10)
+        add_button.grid(row=4, column=0, columnspan=2, pady=10)
 
         # Inquiry Table Frame
         table_frame = tk.LabelFrame(self.root, text="Inquiry List", font=title_font, bg="#E9ECEF")
         table_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
-        self.inquiry_table = ttk.Treeview(table_frame, columns=("Name", "Phone", "Property"), show="headings", height=15)
+        columns = ("Name", "Phone", "Property", "Priority") if self.service.priority else ("Name", "Phone", "Property")
+        self.inquiry_table = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
         self.inquiry_table.heading("Name", text="Name")
         self.inquiry_table.heading("Phone", text="Phone Number")
         self.inquiry_table.heading("Property", text="Property Details")
+        if self.service.priority:
+            self.inquiry_table.heading("Priority", text="Priority")
+            self.inquiry_table.column("Priority", width=100, anchor="center")
 
         self.inquiry_table.column("Name", width=200, anchor="center")
         self.inquiry_table.column("Phone", width=150, anchor="center")
@@ -67,6 +540,16 @@ class RealEstateApp:
         clear_button = tk.Button(action_frame, text="Clear Queue", font=button_font, bg="#DC3545", fg="white", command=self.clear_queue)
         clear_button.pack(side="right", padx=10)
 
+        if self.service.priority:
+            cancel_button = tk.Button(action_frame, text="Cancel Selected", font=button_font, bg="#6C757D", fg="white", command=self.cancel_selected)
+            cancel_button.pack(side="left", padx=10)
+
+            priority_button = tk.Button(action_frame, text="Set Priority", font=button_font, bg="#FD7E14", fg="white", command=self.reprioritize_selected)
+            priority_button.pack(side="left", padx=10)
+
+        self.status_label = tk.Label(action_frame, text="", font=label_font)
+        self.status_label.pack(side="left", padx=10)
+
     def add_inquiry(self):
         name = self.name_entry.get().strip()
         phone = self.phone_entry.get().strip()
@@ -77,45 +560,171 @@ class RealEstateApp:
             return
 
         inquiry = {"name": name, "phone": phone, "property": property_details}
-        self.inquiry_queue.append(inquiry)
-
-        self.inquiry_table.insert("", "end", values=(name, phone, property_details))
+        if self.service.priority:
+            inquiry["priority"] = IndexedPriorityQueue.LEVELS[self.priority_combo.get()]
+        self.enqueue_inquiry(inquiry)
         messagebox.showinfo("Inquiry Added", f"Inquiry added for {name} (Property: {property_details}).")
         self.clear_inputs()
 
     def process_inquiry(self):
-        if not self.inquiry_queue:
+        inquiry = self.dequeue_inquiry()
+        if inquiry is None:
             messagebox.showwarning("No Inquiries", "No inquiries to process.")
             return
 
-        inquiry = self.inquiry_queue.popleft()
-
-        # Find and delete the processed inquiry from the table
-        for item in self.inquiry_table.get_children():
-            if self.inquiry_table.item(item, "values")[1] == inquiry["phone"]:
-                self.inquiry_table.delete(item)
-                break
-
         messagebox.showinfo("Inquiry Processed", f"Processed Inquiry:\nName: {inquiry['name']}\nPhone: {inquiry['phone']}\nProperty: {inquiry['property']}")
 
     def clear_queue(self):
-        if not self.inquiry_queue:
+        if not len(self.service):
             messagebox.showwarning("No Inquiries", "Queue is already empty.")
             return
 
-        self.inquiry_queue.clear()
-        for item in self.inquiry_table.get_children():
-            self.inquiry_table.delete(item)
+        self.service.clear()
+        self.inquiry_items.clear()
+        self.inquiry_table.delete(*self.inquiry_table.get_children())
 
         messagebox.showinfo("Queue Cleared", "All inquiries have been cleared.")
 
+    def cancel_selected(self):
+        cancelled = 0
+        for item_id in self.inquiry_table.selection():
+            inquiry = self.inquiry_items.get(item_id)
+            if inquiry is not None and self.service.cancel(inquiry["id"]) is not None:
+                self.remove_inquiry_row(inquiry)
+                cancelled += 1
+        if not cancelled:
+            messagebox.showwarning("No Selection", "Select a queued inquiry to cancel.")
+
+    def reprioritize_selected(self):
+        level = IndexedPriorityQueue.LEVELS[self.priority_combo.get()]
+        for item_id in self.inquiry_table.selection():
+            inquiry = self.inquiry_items.get(item_id)
+            if inquiry is not None and self.service.change_priority(inquiry["id"], level):
+                self.inquiry_table.set(item_id, "Priority", self.priority_combo.get())
+
+    def show_inquiry(self, inquiry):
+        """Add the table row for an inquiry and remember its item id."""
+        values = (inquiry["name"], inquiry["phone"], inquiry["property"])
+        if self.service.priority:
+            values += (PRIORITY_NAMES[inquiry.get("priority", IndexedPriorityQueue.NORMAL)],)
+        inquiry["item_id"] = self.inquiry_table.insert("", "end", values=values)
+        self.inquiry_items[inquiry["item_id"]] = inquiry
+
+    def remove_inquiry_row(self, inquiry):
+        """Delete exactly this inquiry's row; safe to call more than once."""
+        if self.inquiry_items.pop(inquiry.get("item_id"), None) is not None:
+            self.inquiry_table.delete(inquiry["item_id"])
+
+    def enqueue_inquiry(self, inquiry):
+        self.show_inquiry(inquiry)
+        self.service.submit(inquiry)
+
+    def dequeue_inquiry(self):
+        """Take the oldest inquiry and delete its row, or return None if empty."""
+        inquiry = self.service.take_nowait()
+        if inquiry is not None:
+            self.remove_inquiry_row(inquiry)
+            self.service.task_done(inquiry)
+        return inquiry
+
+    def poll_service(self):
+        """Remove rows finished by workers, refresh the stats and group-commit the journal."""
+        while self.completed:
+            self.remove_inquiry_row(self.completed.popleft())
+        stats = self.service.stats()
+        self.status_label.config(text=f"Queued: {stats['depth']}  In progress: {stats['in_flight']}  "
+                                      f"Processed: {stats['processed']} ({stats['throughput']:.1f}/s)  "
+                                      f"Failed: {stats['failed']}")
+        self.service.sync()
+        self.root.after(self.POLL_INTERVAL, self.poll_service)
+
+    def on_close(self):
+        self.service.shutdown()
+        self.root.destroy()
+
     def clear_inputs(self):
         self.name_entry.delete(0, tk.END)
         self.phone_entry.delete(0, tk.END)
         self.property_entry.delete(0, tk.END)
 
 
-if __name__ == "__main__":
+def benchmark_journal(count=1_000_000):
+    """Measure per-enqueue journal cost and recovery time of a large log."""
+    directory = tempfile.mkdtemp()
+    journal = InquiryJournal(os.path.join(directory, "bench.journal"), compact_min=count * 10)
+    inquiry = {"name": "Client", "phone": "0780000000", "property": "Plot 12, Kicukiro"}
+
+    start = time.perf_counter()
+    for i in range(count):
+        journal.record_enqueue(inquiry)
+        if i % 2:
+            journal.record_process()
+    journal.close()
+    elapsed = time.perf_counter() - start
+    print(f"Journal: {elapsed / count * 1e6:.2f} us per enqueue (with half processed)")
+
+    start = time.perf_counter()
+    pending = InquiryJournal(journal.path).recover()
+    elapsed = time.perf_counter() - start
+    print(f"Recovered {len(pending)} pending of {journal.records} events in {elapsed:.3f}s")
+    os.remove(journal.path)
+    os.rmdir(directory)
+
+
+def benchmark_process_inquiry(sizes=(10, 1_000, 100_000), samples=100):
+    """Time dequeue_inquiry against queues of growing length (needs a display)."""
     root = tk.Tk()
-    app = RealEstateApp(root)
-    root.mainloop()
+    root.withdraw()
+    for size in sizes:
+        app = RealEstateApp.__new__(RealEstateApp)
+        app.root = root
+        app.service = InquiryService()
+        app.inquiry_items = {}
+        app.inquiry_table = ttk.Treeview(root, columns=("Name", "Phone", "Property"), show="headings")
+        for i in range(size + samples):
+            app.enqueue_inquiry({"name": f"Client {i}", "phone": "0780000000", "property": f"Plot {i}"})
+
+        start = time.perf_counter()
+        for _ in range(samples):
+            app.dequeue_inquiry()
+        elapsed = time.perf_counter() - start
+        print(f"{size:>7} queued: {elapsed / samples * 1e6:.1f} us per processed inquiry")
+        app.inquiry_table.destroy()
+    root.destroy()
+
+
+def benchmark_service(count=200_000, producers=4, workers=4):
+    """Push inquiries from several producer threads through the worker pool."""
+    service = InquiryService(workers=workers)
+    service.start()
+    per_producer = count // producers
+
+    def produce(index):
+        for i in range(per_producer):
+            service.submit({"name": f"Client {index}-{i}", "phone": "0780000000", "property": "Plot 12"})
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=produce, args=(i,)) for i in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    peak_depth = service.stats()["depth"]
+    service.shutdown(drain=True)
+    elapsed = time.perf_counter() - start
+    print(f"Service: {service.processed} inquiries, {producers} producers, {workers} workers "
+          f"in {elapsed:.2f}s ({service.processed / elapsed:,.0f}/s, depth {peak_depth} after producing)")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_journal()
+        benchmark_service()
+        benchmark_process_inquiry()
+    else:
+        # --workers N lets a worker pool process inquiries while the window monitors it;
+        # --priority serves urgent inquiries first
+        workers = int(sys.argv[sys.argv.index("--workers") + 1]) if "--workers" in sys.argv else 0
+        root = tk.Tk()
+        app = RealEstateApp(root, InquiryService(workers=workers, journal=InquiryJournal(), priority="--priority" in sys.argv))
+        root.mainloop()
@@ -1,15 +1,30 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+from array import array
+import csv
+import itertools
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from order_btree import OrderBTree
+from table_view import VirtualTable
 
 
 class BinaryTreeNode:
     """Node for the Binary Tree."""
-    def __init__(self, order_id, name, phone, property_details, price):
+    __slots__ = ("order_id", "name", "phone", "property_details", "price", "sequence", "left", "right")
+
+    def __init__(self, order_id, name, phone, property_details, price, sequence=0):
         self.order_id = order_id
         self.name = name
         self.phone = phone
         self.property_details = property_details
         self.price = price
+        self.sequence = sequence  # Arrival order; equal prices are listed in this order
         self.left = None
         self.right = None
 
@@ -18,9 +33,11 @@ class BinaryTree:
     """Binary Tree to manage property orders."""
     def __init__(self):
         self.root = None
+        self.sequence = 0
 
     def insert(self, order_id, name, phone, property_details, price):
-        new_node = BinaryTreeNode(order_id, name, phone, property_details, price)
+        new_node = BinaryTreeNode(order_id, name, phone, property_details, price, self.sequence)
+        self.sequence += 1
         if self.root is None:
             self.root = new_node
         else:
@@ -38,36 +55,560 @@ class BinaryTree:
             else:
                 self._insert_recursive(current.right, new_node)
 
-    def inorder_traversal(self, node=None, result=None):
+    def iter_nodes(self, start_price=None, after=None):
+        """Lazily yield nodes in order using an explicit stack (no recursion).
+
+        start_price skips straight to the first order at or above that price;
+        after resumes just past an order, given as a node or (price, sequence)
+        key, so paging keeps working even if that order has since been removed.
+        """
+        stack = []
+        current = self.root
+        if after is not None:
+            key = (after.price, after.sequence) if isinstance(after, BinaryTreeNode) else after
+            while current is not None:
+                if key < (current.price, current.sequence):
+                    stack.append(current)
+                    current = current.left
+                else:
+                    current = current.right
+        elif start_price is not None:
+            while current is not None:
+                if current.price < start_price:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+        while stack or current is not None:
+            if current is not None:
+                stack.append(current)
+                current = current.left
+                continue
+            node = stack.pop()
+            yield node
+            current = node.right
+
+    def iter_orders(self, start_price=None, after=None):
+        """Like iter_nodes, but yields lightweight (order_id, name, phone, property_details, price) tuples."""
+        for node in self.iter_nodes(start_price, after):
+            yield (node.order_id, node.name, node.phone, node.property_details, node.price)
+
+    def page(self, size, start_price=None, after=None):
+        """Return the next `size` nodes in order, starting as iter_nodes does."""
+        return list(itertools.islice(self.iter_nodes(start_price, after), size))
+
+    def inorder_traversal(self):
         """Perform an in-order traversal to fetch all orders."""
-        if result is None:
-            result = []
-        if node is None:
-            node = self.root
-        if node.left:
-            self.inorder_traversal(node.left, result)
-        result.append({
+        return [{
             "order_id": node.order_id,
             "name": node.name,
             "phone": node.phone,
             "property_details": node.property_details,
             "price": node.price
-        })
-        if node.right:
-            self.inorder_traversal(node.right, result)
-        return result
+        } for node in self.iter_nodes()]
+
+
+class AVLNode(BinaryTreeNode):
+    """Binary tree node that also tracks its height, arrival order and subtree totals."""
+    __slots__ = ("height", "size", "total")
+
+    def __init__(self, order_id, name, phone, property_details, price, sequence):
+        super().__init__(order_id, name, phone, property_details, price, sequence)
+        self.height = 1
+        self.size = 1  # Orders in this subtree
+        self.total = price  # Sum of prices in this subtree
+
+
+class AVLTree(BinaryTree):
+    """Self-balancing (AVL) version of the order tree.
+
+    Orders are keyed on (price, arrival order), so an in-order traversal
+    lists them exactly like BinaryTree does, but the height stays
+    O(log n) even when prices arrive sorted. Insert, delete and search
+    are iterative and rebalance along the path they walked.
+
+    Two hash indexes are kept in sync with the tree: by_id (unique,
+    order_id -> node) and by_phone (phone -> {order_id: node}).
+    """
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.by_id = {}
+        self.by_phone = {}
+
+    def _index(self, node):
+        self.by_id[node.order_id] = node
+        self.by_phone.setdefault(node.phone, {})[node.order_id] = node
+
+    def _unindex(self, node):
+        del self.by_id[node.order_id]
+        orders = self.by_phone[node.phone]
+        del orders[node.order_id]
+        if not orders:
+            del self.by_phone[node.phone]
+
+    def get(self, order_id):
+        """The order with this id, or None, in O(1)."""
+        return self.by_id.get(order_id)
+
+    def find_by_phone(self, phone):
+        """All orders for a client's phone, oldest first, in O(k)."""
+        return list(self.by_phone.get(phone, {}).values())
+
+    def delete_by_id(self, order_id):
+        """Remove an order by id; returns the removed node or None."""
+        node = self.by_id.get(order_id)
+        return self.delete_node(node) if node is not None else None
+
+    def __len__(self):
+        return self.count
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    def _update(self, node):
+        left, right = node.left, node.right
+        node.height = 1 + max(left.height if left else 0, right.height if right else 0)
+        node.size = 1 + (left.size if left else 0) + (right.size if right else 0)
+        node.total = node.price + (left.total if left else 0) + (right.total if right else 0)
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+
+    def _balance(self, node):
+        """Restore the AVL property at node; returns the subtree's new root."""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _rebalance_path(self, path):
+        """Rebalance each node on a root-to-leaf path, bottom up."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_root = self._balance(node)
+            if new_root is not node:
+                if i == 0:
+                    self.root = new_root
+                elif path[i - 1].left is node:
+                    path[i - 1].left = new_root
+                else:
+                    path[i - 1].right = new_root
+
+    def insert(self, order_id, name, phone, property_details, price):
+        if order_id in self.by_id:
+            raise ValueError(f"Order {order_id} already exists")
+        new_node = AVLNode(order_id, name, phone, property_details, price, self.sequence)
+        self.sequence += 1
+        self.count += 1
+        self._index(new_node)
+        if self.root is None:
+            self.root = new_node
+            return new_node
+
+        key = (price, new_node.sequence)
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            current = current.left if key < (current.price, current.sequence) else current.right
+        parent = path[-1]
+        if key < (parent.price, parent.sequence):
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._rebalance_path(path)
+        return new_node
+
+    def _build(self, nodes, low, high):
+        """Link nodes[low:high] (already in key order) into a perfectly balanced subtree."""
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = nodes[middle]
+        node.left = self._build(nodes, low, middle)
+        node.right = self._build(nodes, middle + 1, high)
+        self._update(node)
+        return node
+
+    def bulk_load(self, orders, presorted=False):
+        """Add many (order_id, name, phone, property_details, price) orders at once.
+
+        The batch is sorted by price (skipped when presorted) and merged in
+        linear time with the orders already in the tree, then the whole tree
+        is rebuilt height-balanced bottom up: O(n + m) after sorting, instead
+        of m separate O(log n) inserts with rebalancing.
+        """
+        batch = []
+        for order_id, name, phone, property_details, price in orders:
+            batch.append(AVLNode(order_id, name, phone, property_details, price, self.sequence))
+            self.sequence += 1
+        ids = {node.order_id for node in batch}
+        if len(ids) != len(batch) or not ids.isdisjoint(self.by_id):
+            raise ValueError("Bulk load contains duplicate order ids")
+        for node in batch:
+            self._index(node)
+        if not presorted:
+            batch.sort(key=lambda node: node.price)  # Stable, so ties keep arrival order
+
+        existing = list(self.iter_nodes())
+        if existing:
+            merged = []
+            i = j = 0
+            while i < len(existing) and j < len(batch):
+                # Existing orders arrived first, so they win price ties
+                if batch[j].price < existing[i].price:
+                    merged.append(batch[j])
+                    j += 1
+                else:
+                    merged.append(existing[i])
+                    i += 1
+            merged.extend(existing[i:])
+            merged.extend(batch[j:])
+        else:
+            merged = batch
+        self.root = self._build(merged, 0, len(merged))
+        self.count = len(merged)
+        return len(batch)
+
+    def _prefix(self, price, inclusive):
+        """Count and price sum of orders below price (or at most price if inclusive), in O(log n)."""
+        count = total = 0
+        current = self.root
+        while current is not None:
+            if current.price < price or (inclusive and current.price == price):
+                left = current.left
+                count += 1 + (left.size if left else 0)
+                total += current.price + (left.total if left else 0)
+                current = current.right
+            else:
+                current = current.left
+        return count, total
+
+    def count_below(self, price):
+        """Number of orders priced under price."""
+        return self._prefix(price, False)[0]
+
+    def count_range(self, low, high):
+        """Number of orders with low <= price <= high."""
+        if low > high:
+            return 0
+        return self._prefix(high, True)[0] - self._prefix(low, False)[0]
+
+    def sum_range(self, low, high):
+        """Sum of prices of orders with low <= price <= high."""
+        if low > high:
+            return 0
+        return self._prefix(high, True)[1] - self._prefix(low, False)[1]
+
+    def kth_smallest(self, k):
+        """The k-th cheapest order (k = 1 is the cheapest), or None."""
+        if not 1 <= k <= self.count:
+            return None
+        current = self.root
+        while current is not None:
+            left_size = current.left.size if current.left else 0
+            if k <= left_size:
+                current = current.left
+            elif k == left_size + 1:
+                return current
+            else:
+                k -= left_size + 1
+                current = current.right
+        return None
+
+    def percentile(self, percent):
+        """Price at the given percentile (0-100), using the nearest-rank method."""
+        if not self.count:
+            return None
+        k = max(1, -(-percent * self.count // 100))
+        return self.kth_smallest(min(int(k), self.count)).price
+
+    def median(self):
+        if not self.count:
+            return None
+        middle = self.kth_smallest((self.count + 1) // 2).price
+        if self.count % 2:
+            return middle
+        return (middle + self.kth_smallest(self.count // 2 + 1).price) / 2
+
+    def range_orders(self, low, high):
+        """Lazily yield the nodes with low <= price <= high in price order.
+
+        Subtrees entirely below low are never visited and the walk stops as
+        soon as it passes high.
+        """
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            if current is not None:
+                if current.price < low:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+                continue
+            node = stack.pop()
+            if node.price > high:
+                return
+            yield node
+            current = node.right
+
+    def cheapest(self, n):
+        """The n cheapest orders, in price order."""
+        return list(itertools.islice(self.range_orders(float("-inf"), float("inf")), n))
+
+    def search(self, price):
+        """Return the earliest-inserted order with this price, or None."""
+        found = None
+        current = self.root
+        while current is not None:
+            if price < current.price:
+                current = current.left
+            elif price > current.price:
+                current = current.right
+            else:
+                found = current
+                current = current.left
+        return found
+
+    def delete(self, price, order_id=None):
+        """Remove an order with this price (and order_id, if given).
+
+        Returns the removed node, or None if no such order exists.
+        """
+        # Walk the orders with this price in order; they are contiguous by key
+        stack = []
+        current = self.root
+        while stack or current is not None:
+            if current is not None:
+                if price < current.price:
+                    current = current.left
+                elif price > current.price:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+                continue
+            node = stack.pop()
+            if order_id is None or node.order_id == order_id:
+                return self.delete_node(node)
+            current = node.right
+        return None
+
+    def delete_node(self, target):
+        """Unlink a node that is in the tree and rebalance; returns the node."""
+        key = (target.price, target.sequence)
+        path = []
+        current = self.root
+        while current is not target:
+            path.append(current)
+            current = current.left if key < (current.price, current.sequence) else current.right
+        parent = path[-1] if path else None
+
+        if target.left is not None and target.right is not None:
+            # The in-order successor takes the target's place
+            successor_path = []
+            successor = target.right
+            while successor.left is not None:
+                successor_path.append(successor)
+                successor = successor.left
+            if successor_path:
+                successor_path[-1].left = successor.right
+                successor.right = target.right
+            successor.left = target.left
+            replacement = successor
+            path.append(successor)
+            path.extend(successor_path)
+        else:
+            replacement = target.left if target.left is not None else target.right
+
+        if parent is None:
+            self.root = replacement
+        elif parent.left is target:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        target.left = target.right = None
+        self.count -= 1
+        self._unindex(target)
+        self._rebalance_path(path)
+        return target
+
+
+class ColumnarOrderTree:
+    """Compact order tree stored as parallel arrays instead of node objects.
+
+    Row i holds one order: ids, prices and tree links live in typed arrays
+    (links are row offsets, -1 for none) and the text fields are interned
+    strings in plain lists, so repeated names and details are stored once.
+    Rows are keyed on (price, row), i.e. insertion order breaks price ties,
+    matching BinaryTree. Balance is kept scapegoat-style: when an insert
+    lands too deep, the highest unbalanced subtree on its path is rebuilt.
+    """
+    ALPHA = 2 / 3
+
+    def __init__(self):
+        self.order_ids = array("q")
+        self.prices = array("q")
+        self.left = array("l")
+        self.right = array("l")
+        self.sizes = array("l")
+        self.names = []
+        self.phones = []
+        self.details = []
+        self.root = -1
+
+    def __len__(self):
+        return len(self.prices)
+
+    def _append(self, order_id, name, phone, property_details, price):
+        row = len(self.prices)
+        self.order_ids.append(order_id)
+        self.prices.append(price)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.sizes.append(1)
+        self.names.append(sys.intern(name))
+        self.phones.append(sys.intern(phone))
+        self.details.append(sys.intern(property_details))
+        return row
+
+    def insert(self, order_id, name, phone, property_details, price):
+        row = self._append(order_id, name, phone, property_details, price)
+        if self.root == -1:
+            self.root = row
+            return row
+
+        prices, left, right, sizes = self.prices, self.left, self.right, self.sizes
+        path = []
+        current = self.root
+        while current != -1:
+            path.append(current)
+            sizes[current] += 1
+            # The new row is the newest, so it goes right of equal prices
+            current = left[current] if price < prices[current] else right[current]
+        parent = path[-1]
+        if price < prices[parent]:
+            left[parent] = row
+        else:
+            right[parent] = row
+
+        if len(path) > math.log(len(prices), 1 / self.ALPHA):
+            child = row
+            for i in range(len(path) - 1, -1, -1):
+                if sizes[child] > self.ALPHA * sizes[path[i]]:
+                    self._rebuild(path[i], path[i - 1] if i else -1)
+                    break
+                child = path[i]
+        return row
+
+    def _rows_in_order(self, top):
+        left, right = self.left, self.right
+        rows = []
+        stack = []
+        current = top
+        while stack or current != -1:
+            if current != -1:
+                stack.append(current)
+                current = left[current]
+                continue
+            current = stack.pop()
+            rows.append(current)
+            current = right[current]
+        return rows
+
+    def _link(self, rows, low, high):
+        if low >= high:
+            return -1
+        middle = (low + high) // 2
+        row = rows[middle]
+        self.left[row] = self._link(rows, low, middle)
+        self.right[row] = self._link(rows, middle + 1, high)
+        self.sizes[row] = high - low
+        return row
+
+    def _rebuild(self, top, parent):
+        """Relink the subtree under `top` perfectly balanced."""
+        rows = self._rows_in_order(top)
+        new_top = self._link(rows, 0, len(rows))
+        if parent == -1:
+            self.root = new_top
+        elif self.left[parent] == top:
+            self.left[parent] = new_top
+        else:
+            self.right[parent] = new_top
+
+    def bulk_load(self, orders, presorted=False):
+        """Append many orders and relink the whole tree balanced in one pass."""
+        start = len(self.prices)
+        for order in orders:
+            self._append(*order)
+        if start == 0 and presorted:
+            rows = list(range(len(self.prices)))
+        else:
+            prices = self.prices
+            rows = sorted(range(len(prices)), key=prices.__getitem__)  # Stable: ties stay in row order
+        self.root = self._link(rows, 0, len(rows))
+        return len(self.prices) - start
+
+    def iter_orders(self, start_price=None):
+        """Lazily yield (order_id, name, phone, property_details, price) in price order."""
+        prices, left, right = self.prices, self.left, self.right
+        stack = []
+        current = self.root
+        if start_price is not None:
+            while current != -1:
+                if prices[current] < start_price:
+                    current = right[current]
+                else:
+                    stack.append(current)
+                    current = left[current]
+        while stack or current != -1:
+            if current != -1:
+                stack.append(current)
+                current = left[current]
+                continue
+            row = stack.pop()
+            yield (self.order_ids[row], self.names[row], self.phones[row], self.details[row], prices[row])
+            current = right[row]
+
+    def inorder_traversal(self):
+        return [dict(zip(("order_id", "name", "phone", "property_details", "price"), order)) for order in self.iter_orders()]
 
 
 class RealEstateApp:
-    def __init__(self, root):
+    def __init__(self, root, orders_tree=None):
         self.root = root
         self.root.title("Real Estate Property Management (Binary Tree-Based)")
         self.root.state("zoomed")
         self.root.configure(bg="#F8F9FA")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        # Data Structure
-        self.orders_tree = BinaryTree()
-        self.order_id_counter = 1
+        # Data Structure: in-memory AVL tree unless a disk-backed tree is passed in
+        self.orders_tree = orders_tree if orders_tree is not None else AVLTree()
+        self.order_id_counter = len(self.orders_tree) + 1
 
         # UI Elements
         self.create_ui()
@@ -117,7 +658,10 @@ class RealEstateApp:
         self.orders_table.column("Phone", width=150, anchor="center")
         self.orders_table.column("Property", width=300, anchor="center")
         self.orders_table.column("Price", width=100, anchor="center")
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.orders_table.yview)
+        scrollbar.pack(side="right", fill="y", pady=10)
         self.orders_table.pack(fill="both", expand=True, padx=10, pady=10)
+        self.table = VirtualTable(self.orders_table, scrollbar=scrollbar)
 
         # Action Buttons
         action_frame = ttk.Frame(self.root)
@@ -126,6 +670,38 @@ class RealEstateApp:
         view_button = tk.Button(action_frame, text="View All Orders", font=button_font, bg="#007BFF", fg="white", command=self.view_orders)
         view_button.pack(side="left", padx=10)
 
+        load_button = tk.Button(action_frame, text="Load Orders CSV", font=button_font, bg="#6F42C1", fg="white", command=self.load_orders)
+        load_button.pack(side="left", padx=10)
+
+        # Price range queries answered from the tree's subtree sizes and sums
+        tk.Label(action_frame, text="Min Price:", font=label_font).pack(side="left", padx=(30, 5))
+        self.min_price_entry = ttk.Entry(action_frame, width=12)
+        self.min_price_entry.pack(side="left")
+        tk.Label(action_frame, text="Max Price:", font=label_font).pack(side="left", padx=(10, 5))
+        self.max_price_entry = ttk.Entry(action_frame, width=12)
+        self.max_price_entry.pack(side="left")
+
+        range_button = tk.Button(action_frame, text="Search Price Range", font=button_font, bg="#17A2B8", fg="white", command=self.search_price_range)
+        range_button.pack(side="left", padx=10)
+
+        self.stats_label = tk.Label(action_frame, text="", font=label_font)
+        self.stats_label.pack(side="left", padx=10)
+
+        # Lookups by order id or client phone go through the tree's hash indexes
+        search_frame = ttk.Frame(self.root)
+        search_frame.pack(fill="x", padx=20, pady=(0, 10))
+
+        tk.Label(search_frame, text="Order ID or Phone:", font=label_font).pack(side="left", padx=10)
+        self.search_entry = ttk.Entry(search_frame, width=20)
+        self.search_entry.pack(side="left")
+        self.search_entry.bind("<Return>", lambda event: self.search_orders())
+
+        search_button = tk.Button(search_frame, text="Search", font=button_font, bg="#17A2B8", fg="white", command=self.search_orders)
+        search_button.pack(side="left", padx=10)
+
+        delete_button = tk.Button(search_frame, text="Delete Selected", font=button_font, bg="#DC3545", fg="white", command=self.delete_selected)
+        delete_button.pack(side="left", padx=10)
+
     def add_order(self):
         name = self.name_entry.get().strip()
         phone = self.phone_entry.get().strip()
@@ -145,12 +721,101 @@ class RealEstateApp:
         messagebox.showinfo("Order Added", f"Order {order_id} added for {name} (Property: {property_details}).")
         self.clear_inputs()
 
-    def view_orders(self):
-        orders = self.orders_tree.inorder_traversal()
-        self.orders_table.delete(*self.orders_table.get_children())
+    def search_orders(self):
+        if not hasattr(self.orders_tree, "get"):
+            messagebox.showinfo("Not Supported", "Searching by ID or phone needs the in-memory order tree.")
+            return
+        query = self.search_entry.get().strip()
+        if not query.isdigit():
+            messagebox.showerror("Input Error", "Enter an order ID or a 10-digit phone number.")
+            return
+        if len(query) == 10:
+            nodes = self.orders_tree.find_by_phone(query)
+        else:
+            node = self.orders_tree.get(int(query))
+            nodes = [node] if node is not None else []
+        if not nodes:
+            messagebox.showinfo("No Match", f"No orders found for {query}.")
+        self.table.load((node.order_id, (node.order_id, node.name, node.phone, node.property_details, node.price)) for node in nodes)
+
+    def delete_selected(self):
+        selected = self.orders_table.selection()
+        if not selected:
+            messagebox.showwarning("No Selection", "Select the orders to delete.")
+            return
+        if not hasattr(self.orders_tree, "delete_by_id"):
+            messagebox.showinfo("Not Supported", "Deleting orders needs the in-memory order tree.")
+            return
+        for item_id in selected:
+            if self.orders_tree.delete_by_id(int(item_id)) is not None:
+                self.table.remove(int(item_id))
 
-        for order in orders:
-            self.orders_table.insert("", "end", values=(order["order_id"], order["name"], order["phone"], order["property_details"], order["price"]))
+    def view_orders(self):
+        if not len(self.orders_tree):
+            self.table.clear()
+            return
+        self.table.load(self.order_rows())
+
+    def order_rows(self):
+        """Yield table rows a page at a time, resuming each page from the last order shown.
+
+        Each page is a fresh O(log n) descent, so orders added between pages
+        cannot invalidate the walk.
+        """
+        last = None
+        while True:
+            page = self.orders_tree.page(self.table.page_size, after=last)
+            if not page:
+                return
+            for node in page:
+                yield node.order_id, (node.order_id, node.name, node.phone, node.property_details, node.price)
+            last = page[-1]
+
+    def search_price_range(self):
+        low = self.min_price_entry.get().strip() or "0"
+        high = self.max_price_entry.get().strip()
+        if not low.isdigit() or (high and not high.isdigit()):
+            messagebox.showerror("Input Error", "Prices must be whole numbers.")
+            return
+        low = int(low)
+        high = int(high) if high else float("inf")
+
+        tree = self.orders_tree
+        count = tree.count_range(low, high)
+        total = tree.sum_range(low, high)
+        average = f"{total / count:,.0f}" if count else "-"
+        median = tree.median()
+        median = "-" if median is None else median  # A median price of 0 is still a median
+        self.stats_label.config(text=f"{count} orders in range, total {total:,}, average {average}, overall median {median}")
+        self.table.load((node.order_id, (node.order_id, node.name, node.phone, node.property_details, node.price)) for node in tree.range_orders(low, high))
+
+    def load_orders(self):
+        """Bulk-load historical orders from a CSV of name, phone, property details, price."""
+        path = filedialog.askopenfilename(title="Load Orders", filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        orders = []
+        skipped = 0
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            for row in csv.reader(file):
+                if len(row) != 4:
+                    skipped += 1
+                    continue
+                name, phone, property_details, price = (field.strip() for field in row)
+                if not name or len(phone) != 10 or not phone.isdigit() or not property_details or not price.isdigit():
+                    skipped += 1
+                    continue
+                orders.append((self.order_id_counter, name, phone, property_details, int(price)))
+                self.order_id_counter += 1
+        loaded = self.orders_tree.bulk_load(orders)
+        messagebox.showinfo("Orders Loaded", f"Loaded {loaded} orders ({skipped} rows skipped).")
+        if self.table.active:
+            self.view_orders()
+
+    def on_close(self):
+        if isinstance(self.orders_tree, OrderBTree):
+            self.orders_tree.close()
+        self.root.destroy()
 
     def clear_inputs(self):
         self.name_entry.delete(0, tk.END)
@@ -159,7 +824,96 @@ class RealEstateApp:
         self.price_entry.delete(0, tk.END)
 
 
+def benchmark_sorted_inserts(count=1_000_000):
+    """Insert orders with ascending prices, the worst case for the plain BST."""
+    tree = AVLTree()
+    start = time.perf_counter()
+    for i in range(count):
+        tree.insert(i, "Client", "0780000000", "Plot", i)
+    elapsed = time.perf_counter() - start
+    print(f"AVLTree: {count} sorted inserts in {elapsed:.2f}s, height {tree.root.height}")
+
+    start = time.perf_counter()
+    queries = 100_000
+    for i in range(queries):
+        tree.count_range(i, i + count // 10)
+        tree.kth_smallest(i + 1)
+    tree.percentile(90)
+    elapsed = time.perf_counter() - start
+    print(f"AVLTree: {queries} range counts + k-th lookups in {elapsed:.2f}s")
+
+    start = time.perf_counter()
+    for price in range(0, count, 2):
+        tree.delete(price)
+    elapsed = time.perf_counter() - start
+    print(f"AVLTree: {count // 2} deletes in {elapsed:.2f}s, height {tree.root.height}")
+
+
+def benchmark_bulk_load(count=1_000_000):
+    """Bulk-load sorted and shuffled orders, then merge a second sorted batch in."""
+    orders = [(i, "Client", "0780000000", "Plot", i) for i in range(count)]
+    start = time.perf_counter()
+    tree = AVLTree()
+    tree.bulk_load(orders, presorted=True)
+    print(f"AVLTree: bulk-loaded {count} sorted orders in {time.perf_counter() - start:.2f}s, height {tree.root.height}")
+
+    random.shuffle(orders)
+    start = time.perf_counter()
+    tree = AVLTree()
+    tree.bulk_load(orders)
+    print(f"AVLTree: bulk-loaded {count} shuffled orders in {time.perf_counter() - start:.2f}s, height {tree.root.height}")
+
+    batch = [(count + i, "Client", "0780000000", "Plot", i * 10) for i in range(count // 10)]
+    start = time.perf_counter()
+    tree.bulk_load(batch, presorted=True)
+    print(f"AVLTree: merged {len(batch)} more orders in {time.perf_counter() - start:.2f}s, height {tree.root.height}")
+
+
+def benchmark_memory(count=1_000_000):
+    """Report traced bytes per order for each storage backend."""
+    def orders():
+        for i in range(count):
+            yield (i, f"Client {i % 5000}", f"078{i % 10_000_000:07d}", f"Plot {i % 2000}, Kigali", (i * 7919) % 100_000_000)
+
+    for name, make in (("AVLTree (__slots__ nodes)", AVLTree), ("ColumnarOrderTree", ColumnarOrderTree)):
+        tracemalloc.start()
+        tree = make()
+        tree.bulk_load(orders())
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{name}: {used / count:.0f} bytes per order at {count} orders")
+        del tree
+
+
+def benchmark_btree(count=1_000_000, path="orders_benchmark.btree"):
+    """Build an on-disk B+tree, reopen it and time a cold range scan."""
+    if os.path.exists(path):
+        os.remove(path)
+    start = time.perf_counter()
+    with OrderBTree(path) as tree:
+        for i in range(count):
+            tree.insert(i, "Client", "0780000000", "Plot", (i * 7919) % 100_000_000)
+    print(f"OrderBTree: {count} inserts in {time.perf_counter() - start:.2f}s, {os.path.getsize(path) / 2**20:.0f} MiB on disk")
+
+    start = time.perf_counter()
+    tree = OrderBTree(path, cache_pages=64)
+    opened = time.perf_counter() - start
+    start = time.perf_counter()
+    found = sum(1 for _ in tree.range_orders(50_000_000, 51_000_000))
+    print(f"OrderBTree: reopened in {opened * 1000:.1f}ms, scanned {found} orders in range in {time.perf_counter() - start:.3f}s")
+    tree.close()
+    os.remove(path)
+
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = RealEstateApp(root)
-    root.mainloop()
+    if "--benchmark" in sys.argv:
+        benchmark_btree()
+        benchmark_memory()
+        benchmark_bulk_load()
+        benchmark_sorted_inserts()
+    else:
+        root = tk.Tk()
+        # --btree PATH keeps orders in an on-disk B+tree file instead of memory
+        orders_tree = OrderBTree(sys.argv[sys.argv.index("--btree") + 1]) if "--btree" in sys.argv else None
+        app = RealEstateApp(root, orders_tree)
+        root.mainloop()
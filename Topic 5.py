@@ -1,69 +1,209 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
+import csv
+import heapq
+import sys
+import time
+
+from table_view import VirtualTable
 
 class Node:
+    __slots__ = ("order_id", "name", "phone", "property_details", "price", "added", "stamp", "prev", "next")
+
     def __init__(self, order_id, name, phone, property_details, price):
         self.order_id = order_id
         self.name = name
         self.phone = phone
         self.property_details = property_details
         self.price = price
+        self.added = 0.0
+        self.stamp = None  # Matches the node's live entries in the min/max heaps; None once removed
+        self.prev = None
         self.next = None
 
 class CircularLinkedList:
-    def __init__(self, limit=5):
+    """Doubly linked ring of the most recent orders, oldest at head.
+
+    An order_id -> node map makes lookup, removal and move_to_front O(1),
+    so the list works as an LRU-style cache of any size: inserting past
+    `limit` evicts the head, the least recently added or touched order.
+
+    With max_age (seconds) set, the list is a sliding window that also
+    evicts orders older than max_age. Running count, total, min and max
+    price are kept up to date as orders come and go: the total in O(1),
+    the min and max from heaps with lazy deletion in O(log n) amortized.
+    A removed or touched order only has its heap entries marked stale;
+    stale entries are skipped when they reach the top, and the heaps are
+    rebuilt once stale entries outnumber live ones.
+
+    Subscribers are called as callback(event, node) after every change:
+    "inserted", "evicted" (limit or age), "removed" (by id) and "cleared"
+    (node is None). move_to_front reports "removed" then "inserted".
+    """
+    def __init__(self, limit=5, max_age=None, clock=time.monotonic):
         self.head = None
         self.tail = None
         self.size = 0
         self.limit = limit
+        self.max_age = max_age
+        self.clock = clock
+        self.nodes = {}  # order_id -> Node
+        self.total = 0
+        self.stamps = 0
+        self.min_heap = []  # (price, stamp, node); stale once node.stamp != stamp
+        self.max_heap = []  # (-price, stamp, node)
+        self.listeners = []
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def _emit(self, event, node):
+        for callback in self.listeners:
+            callback(event, node)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, order_id):
+        return order_id in self.nodes
+
+    def get(self, order_id):
+        return self.nodes.get(order_id)
 
     def insert(self, order_id, name, phone, property_details, price):
+        if order_id in self.nodes:
+            raise ValueError(f"Order {order_id} is already in the list")
         new_node = Node(order_id, name, phone, property_details, price)
+        new_node.added = self.clock()
+        evicted = self.expire(new_node.added)
         if self.size >= self.limit:
-            self.remove_front()
-        
+            evicted.append(self.remove_front())
+        self._link(new_node)
+        self.nodes[order_id] = new_node
+        self._push_aggregates(new_node)
+        self._emit("inserted", new_node)
+        return evicted
+
+    def expire(self, now=None):
+        """Evict orders older than max_age and return their nodes, oldest first."""
+        evicted = []
+        if self.max_age is None:
+            return evicted
+        cutoff = (self.clock() if now is None else now) - self.max_age
+        while self.head and self.head.added <= cutoff:
+            evicted.append(self.remove_front())
+        return evicted
+
+    def _push_aggregates(self, node):
+        self.total += node.price
+        self.stamps += 1
+        node.stamp = self.stamps
+        # The stamp is unique, so entries never compare the nodes themselves
+        heapq.heappush(self.min_heap, (node.price, node.stamp, node))
+        heapq.heappush(self.max_heap, (-node.price, node.stamp, node))
+
+    def _drop_aggregates(self, node):
+        self.total -= node.price
+        node.stamp = None  # Its heap entries are now stale
+        if len(self.min_heap) > 2 * self.size + 16:
+            # Rebuild in O(n) once stale entries dominate, so memory stays O(size)
+            self.min_heap = [entry for entry in self.min_heap if entry[2].stamp == entry[1]]
+            self.max_heap = [entry for entry in self.max_heap if entry[2].stamp == entry[1]]
+            heapq.heapify(self.min_heap)
+            heapq.heapify(self.max_heap)
+
+    @staticmethod
+    def _live_top(heap):
+        while heap and heap[0][2].stamp != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def min_price(self):
+        return self._live_top(self.min_heap)
+
+    def max_price(self):
+        top = self._live_top(self.max_heap)
+        return -top if top is not None else None
+
+    def stats(self):
+        """Expire old orders, then return the window's count, total, average, min and max price."""
+        self.expire()
+        return {
+            "count": self.size,
+            "total": self.total,
+            "average": self.total / self.size if self.size else None,
+            "min": self.min_price(),
+            "max": self.max_price()
+        }
+
+    def _link(self, node):
+        """Attach a node at the tail, between the current tail and head."""
         if not self.head:
-            self.head = self.tail = new_node
-            self.head.next = self.head
+            self.head = self.tail = node
+            node.prev = node.next = node
         else:
-            self.tail.next = new_node
-            new_node.next = self.head
-            self.tail = new_node
-        
+            node.prev = self.tail
+            node.next = self.head
+            self.tail.next = node
+            self.head.prev = node
+            self.tail = node
         self.size += 1
 
-    def remove_front(self):
-        if not self.head:
-            return
-        if self.head == self.tail:
+    def _unlink(self, node):
+        if node.next is node:
             self.head = self.tail = None
         else:
-            self.head = self.head.next
-            self.tail.next = self.head
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            if node is self.head:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = node.prev
+        node.prev = node.next = None
         self.size -= 1
 
-    def remove_by_id(self, order_id):
-        if not self.head:
-            return False
+    def remove_front(self):
+        """Evict the oldest order and return its node."""
+        node = self._drop_head()
+        if node is not None:
+            self._emit("evicted", node)
+        return node
 
-        current = self.head
-        prev = self.tail
+    def _drop_head(self):
+        if not self.head:
+            return None
+        node = self.head
+        self._unlink(node)
+        del self.nodes[node.order_id]
+        self._drop_aggregates(node)
+        return node
 
-        while True:
-            if current.order_id == order_id:
-                if current == self.head:
-                    self.remove_front()
-                else:
-                    prev.next = current.next
-                    if current == self.tail:
-                        self.tail = prev
-                    self.size -= 1
-                return True
-            prev = current
-            current = current.next
-            if current == self.head:
-                break
-        return False
+    def remove_by_id(self, order_id):
+        node = self.nodes.get(order_id)
+        if node is None:
+            return False
+        del self.nodes[order_id]
+        self._unlink(node)
+        self._drop_aggregates(node)
+        self._emit("removed", node)
+        return True
+
+    def move_to_front(self, order_id):
+        """Mark an order as most recently used, so it is the last to be evicted."""
+        node = self.nodes.get(order_id)
+        if node is None:
+            return False
+        # Touching an order restarts its age, keeping the ring sorted by time
+        node.added = self.clock()
+        if node is not self.tail:
+            self._unlink(node)
+            self._link(node)
+            # Re-entered as a new order: its old heap entries go stale
+            self._drop_aggregates(node)
+            self._push_aggregates(node)
+            self._emit("removed", node)
+            self._emit("inserted", node)
+        return True
 
     def to_list(self):
         data = []
@@ -88,18 +228,26 @@ class CircularLinkedList:
         self.head = None
         self.tail = None
         self.size = 0
+        self.nodes.clear()
+        self.total = 0
+        self.min_heap.clear()
+        self.max_heap.clear()
+        self._emit("cleared", None)
 
 class RealEstateApp:
-    def __init__(self, root):
+    def __init__(self, root, limit=5, max_age=None):
         self.root = root
         self.root.title("Real Estate Property Management System")
         self.root.state('zoomed')  # Maximize the window
         self.root.configure(bg="#f0f8ff")  # Light blue background
 
-        self.orders_list = CircularLinkedList(limit=5)
+        self.orders_list = CircularLinkedList(limit=limit, max_age=max_age)
         self.order_id_counter = 1
+        self.changes = []  # (event, node) pairs received since the last repaint
+        self.repaint_pending = False
 
         self.create_ui()
+        self.orders_list.subscribe(self.on_list_change)
 
     def create_ui(self):
         # Input Frame
@@ -141,7 +289,11 @@ class RealEstateApp:
         self.orders_table.heading("Phone", text="Phone")
         self.orders_table.heading("Property", text="Property Details")
         self.orders_table.heading("Price", text="Price")
+        scrollbar = ttk.Scrollbar(orders_frame, orient="vertical", command=self.orders_table.yview)
+        scrollbar.pack(side="right", fill="y")
         self.orders_table.pack(fill="both", expand=True)
+        self.table = VirtualTable(self.orders_table, scrollbar=scrollbar)
+        self.table.load(())  # Show orders as they are added, like the original rebuild did
 
         # Action Buttons Frame
         action_frame = ttk.Frame(self.root)
@@ -153,9 +305,49 @@ class RealEstateApp:
         remove_button = ttk.Button(action_frame, text="Remove Order by ID", command=self.prompt_remove_order, style="RemoveOrder.TButton")
         remove_button.pack(side="left", padx=10)
 
+        import_button = ttk.Button(action_frame, text="Import Orders", command=self.import_orders, style="ViewOrder.TButton")
+        import_button.pack(side="left", padx=10)
+
         clear_button = ttk.Button(action_frame, text="Clear All Orders", command=self.clear_orders, style="ClearOrder.TButton")
         clear_button.pack(side="right", padx=10)
 
+        self.stats_label = ttk.Label(action_frame, font=("Arial", 12))
+        self.stats_label.pack(side="left", padx=20)
+        self.refresh_stats()
+
+    def on_list_change(self, event, node):
+        """Queue a change from the order list and schedule one repaint for the whole burst."""
+        self.changes.append((event, node))
+        if not self.repaint_pending:
+            self.repaint_pending = True
+            self.root.after_idle(self.apply_changes)
+
+    def apply_changes(self):
+        """Apply queued changes to the table, skipping orders added and dropped in the same burst."""
+        self.repaint_pending = False
+        changes, self.changes = self.changes, []
+        added = {}  # order_id -> node inserted during this burst and not yet shown
+        for event, node in changes:
+            if event == "inserted":
+                added[node.order_id] = node
+            elif event == "cleared":
+                added.clear()
+                self.table.clear()
+            elif added.pop(node.order_id, None) is None:
+                self.table.remove(node.order_id)
+        for node in added.values():
+            self.table.append(node.order_id, (node.order_id, node.name, node.phone, node.property_details, node.price))
+
+    def refresh_stats(self):
+        """Show the running price aggregates; stats() also evicts orders that aged out of the window."""
+        stats = self.orders_list.stats()
+        if stats["count"]:
+            text = f"{stats['count']} orders, total {stats['total']:,}, average {stats['average']:,.0f}, min {stats['min']:,}, max {stats['max']:,}"
+        else:
+            text = "No recent orders"
+        self.stats_label.config(text=text)
+        self.root.after(1000, self.refresh_stats)
+
     def add_order(self):
         name = self.name_entry.get().strip()
         phone = self.phone_entry.get().strip()
@@ -173,15 +365,31 @@ class RealEstateApp:
         self.order_id_counter += 1
         messagebox.showinfo("Order Added", f"Order {order_id} added for {name} (Property: {property_details}).")
         self.clear_inputs()
-        self.update_order_list()
 
-    def update_order_list(self):
-        for item in self.orders_table.get_children():
-            self.orders_table.delete(item)
+    def import_orders(self):
+        """Insert every valid name, phone, property details, price row of a CSV file."""
+        path = filedialog.askopenfilename(title="Import Orders", filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        imported = skipped = 0
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            for row in csv.reader(file):
+                if len(row) != 4:
+                    skipped += 1
+                    continue
+                name, phone, property_details, price = (field.strip() for field in row)
+                if not name or len(phone) != 10 or not phone.isdigit() or not property_details or not price.isdigit():
+                    skipped += 1
+                    continue
+                self.orders_list.insert(self.order_id_counter, name, phone, property_details, int(price))
+                self.order_id_counter += 1
+                imported += 1
+        messagebox.showinfo("Orders Imported", f"Imported {imported} orders ({skipped} rows skipped).")
 
+    def update_order_list(self):
+        self.changes.clear()  # The reload below already reflects them
         orders = self.orders_list.to_list()
-        for order in orders:
-            self.orders_table.insert("", tk.END, values=(order["order_id"], order["name"], order["phone"], order["property_details"], order["price"]))
+        self.table.load((order["order_id"], (order["order_id"], order["name"], order["phone"], order["property_details"], order["price"])) for order in orders)
 
     def prompt_remove_order(self):
         order_id = simpledialog.askinteger("Remove Order", "Enter Order ID to remove:")
@@ -192,11 +400,9 @@ class RealEstateApp:
             messagebox.showinfo("Order Removed", f"Order {order_id} has been removed.")
         else:
             messagebox.showerror("Order Not Found", f"No order found with ID {order_id}.")
-        self.update_order_list()
 
     def clear_orders(self):
         self.orders_list.clear()
-        self.update_order_list()
         messagebox.showinfo("Orders Cleared", "All orders have been cleared.")
 
     def clear_inputs(self):
@@ -214,5 +420,8 @@ if __name__ == "__main__":
     style.configure("RemoveOrder.TButton", background="red", foreground="black", font=("Arial", 12, "bold"))
     style.configure("ClearOrder.TButton", background="orange", foreground="black", font=("Arial", 12, "bold"))
     style.configure("Custom.Treeview", rowheight=30, font=("Arial", 12, "bold"), foreground="black")
-    app = RealEstateApp(root)
+    # --limit N keeps more recent orders; --window SECONDS also evicts orders older than that
+    limit = int(sys.argv[sys.argv.index("--limit") + 1]) if "--limit" in sys.argv else 5
+    window = float(sys.argv[sys.argv.index("--window") + 1]) if "--window" in sys.argv else None
+    app = RealEstateApp(root, limit, window)
     root.mainloop()
@@ -1,5 +1,15 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+import os
+import random
+import sys
+import time
+
+from hierarchy_view import HierarchyView, iter_outline
+from tree_snapshot import NO_PARENT, TreeSnapshot
+
+SNAPSHOT = TreeSnapshot(("name", "category"))
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "properties6.snapshot")
 
 # TreeNode Class to represent each node in the tree
 class TreeNode:
@@ -7,8 +17,13 @@ class TreeNode:
         self.name = name
         self.category = category
         self.children = []  # A list to store children nodes
+        self.parent = None
+        self.path = name  # Names from the root down to this node, joined by "/"
+        self.serial = None  # Position in the snapshot file, once saved
 
     def add_child(self, child_node):
+        child_node.parent = self
+        child_node.path = f"{self.path}/{child_node.name}"
         self.children.append(child_node)
 
 
@@ -16,35 +31,93 @@ class TreeNode:
 class BinaryTree:
     def __init__(self):
         self.root = None
+        self.by_name = {}  # name -> nodes with that name, in the order they were added
+        self.by_path = {}  # full path -> node
+        self.saved = []  # Nodes written to the snapshot file, by serial number
+        self.unsaved = []  # Nodes added since the last save
+
+    def _index(self, node):
+        self.by_name.setdefault(node.name, []).append(node)
+        self.by_path.setdefault(node.path, node)
 
     def add_node(self, new_node):
         if self.root is None:
             self.root = new_node
         else:
             self._add(self.root, new_node)
+        self._index(new_node)
+        self.unsaved.append(new_node)
 
     def _add(self, node, new_node):
-        if new_node.name < node.name:
-            if node.children and len(node.children) > 0:
-                self._add(node.children[0], new_node)
-            else:
-                node.add_child(new_node)
-        else:
-            if len(node.children) == 2:
-                self._add(node.children[1], new_node)
-            else:
-                node.add_child(new_node)
+        # Walk down in a loop so long chains of nodes cannot hit the recursion limit
+        while True:
+            if new_node.name < node.name:
+                if node.children:
+                    node = node.children[0]
+                    continue
+            elif len(node.children) == 2:
+                node = node.children[1]
+                continue
+            node.add_child(new_node)
+            return
+
+    def add_child(self, parent, new_node):
+        parent.add_child(new_node)
+        self._index(new_node)
+        self.unsaved.append(new_node)
 
-    def find_node(self, node, name):
+    def find_node(self, name):
+        """Find a node by full path from the root (e.g. "Industry/Residential") or else by name, in O(1).
+
+        When several branches hold the same name, the name lookup returns the
+        one added first; use the full path to pick another.
+        """
+        node = self.by_path.get(name)
         if node is None:
-            return None
-        if node.name == name:
-            return node
-        for child in node.children:
-            found_node = self.find_node(child, name)
-            if found_node:
-                return found_node
-        return None
+            nodes = self.by_name.get(name)
+            node = nodes[0] if nodes else None
+        return node
+
+    def save(self, path=SNAPSHOT_PATH):
+        """Write a full snapshot of the tree, replacing any earlier one."""
+        self.saved = SNAPSHOT.save(path, self.root)
+        self.unsaved.clear()
+
+    def save_changes(self, path=SNAPSHOT_PATH):
+        """Append only the subtrees added since the last save, or write a full snapshot if there is none."""
+        if not self.unsaved:
+            return
+        if self.root is None or self.root.serial is None or not os.path.exists(path):
+            self.save(path)
+            return
+        # New nodes under an already saved parent start a subtree; the rest are inside one
+        roots = [node for node in self.unsaved if node.parent.serial is not None]
+        self.saved += SNAPSHOT.append(path, roots, len(self.saved))
+        self.unsaved.clear()
+
+    @classmethod
+    def load(cls, path=SNAPSHOT_PATH):
+        """Build a tree from a snapshot file: the full tree plus any appended changes."""
+        tree = cls()
+        for parent_serial, nodes in SNAPSHOT.load(path, TreeNode):
+            tree._attach_loaded(parent_serial, nodes)
+        return tree
+
+    def _attach_loaded(self, parent_serial, nodes):
+        root = nodes[0]
+        if parent_serial == NO_PARENT:
+            self.root = root
+        else:
+            self.saved[parent_serial].add_child(root)
+        by_name, by_path = self.by_name, self.by_path
+        for serial, node in enumerate(nodes, len(self.saved)):
+            if node is not root:
+                node.path = f"{node.parent.path}/{node.name}"
+            node.serial = serial
+            # Same as _index, inlined since this runs once per loaded node
+            by_name.setdefault(node.name, []).append(node)
+            by_path.setdefault(node.path, node)
+        self.saved += nodes
 
 
 # Application Class to create the GUI
@@ -55,7 +128,8 @@ class RealEstateApp:
         self.root.geometry("800x600")  # Initial size, but it will expand to fullscreen
         self.root.state("zoomed")  # Fullscreen
         self.root.resizable(True, True)  # Allow resizing
-        self.tree = BinaryTree()
+        self.tree = self.load_tree()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # UI Elements
         self.create_ui()
@@ -90,12 +164,44 @@ class RealEstateApp:
         view_frame = ttk.LabelFrame(self.root, text="View Property Tree", width=800, height=200)
         view_frame.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
 
-        self.property_list = tk.Text(view_frame, height=10, width=80, font=("Arial", 12))
-        self.property_list.grid(row=0, column=0, padx=20, pady=10)
+        # Children are loaded only when their parent row is expanded
+        self.property_tree = ttk.Treeview(view_frame, columns=("Category",), height=10)
+        self.property_tree.heading("#0", text="Property")
+        self.property_tree.heading("Category", text="Category")
+        self.property_tree.grid(row=0, column=0, padx=20, pady=10, sticky="nsew")
+        scrollbar = ttk.Scrollbar(view_frame, orient="vertical", command=self.property_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.property_tree.configure(yscrollcommand=scrollbar.set)
+        self.hierarchy = HierarchyView(self.property_tree, lambda node: (node.category,))
 
         view_button = ttk.Button(view_frame, text="View Property Tree", command=self.view_tree)
         view_button.grid(row=1, column=0, pady=20, sticky="ew")
 
+        export_button = ttk.Button(view_frame, text="Export Tree", command=self.export_tree)
+        export_button.grid(row=2, column=0, pady=10, sticky="ew")
+
+        save_button = ttk.Button(view_frame, text="Save Snapshot", command=self.save_snapshot)
+        save_button.grid(row=3, column=0, pady=10, sticky="ew")
+
+    def load_tree(self):
+        """Restore the properties saved by the last session, if any."""
+        if not os.path.exists(SNAPSHOT_PATH):
+            return BinaryTree()
+        try:
+            return BinaryTree.load(SNAPSHOT_PATH)
+        except ValueError as error:
+            messagebox.showerror("Snapshot Error", f"Could not load saved properties: {error}")
+            return BinaryTree()
+
+    def save_snapshot(self):
+        """Write a full snapshot, folding in every incremental save made so far."""
+        self.tree.save(SNAPSHOT_PATH)
+        messagebox.showinfo("Snapshot Saved", f"Property tree saved to {SNAPSHOT_PATH}.")
+
+    def on_close(self):
+        self.tree.save_changes(SNAPSHOT_PATH)  # Only the properties added this session
+        self.root.destroy()
+
     def add_property(self):
         parent_name = self.parent_combo.get().strip()
         name = self.name_entry.get().strip()
@@ -106,10 +212,10 @@ class RealEstateApp:
             return
 
         # Check if the parent exists
-        parent_node = self.tree.find_node(self.tree.root, parent_name)
+        parent_node = self.tree.find_node(parent_name)
         if parent_node:
             new_property = TreeNode(name, category)
-            parent_node.add_child(new_property)
+            self.tree.add_child(parent_node, new_property)
             messagebox.showinfo("Property Added", f"Property '{name}' added under {parent_name} ({category}).")
             self.clear_inputs()
         else:
@@ -127,16 +233,20 @@ class RealEstateApp:
             messagebox.showinfo("Tree Empty", "No properties available.")
             return
 
-        property_info = []
-        self._view_tree(self.tree.root, property_info)
-        self.property_list.delete(1.0, tk.END)
-        self.property_list.insert(tk.END, "\n".join(property_info))
+        self.hierarchy.load(self.tree.root)
 
-    def _view_tree(self, node, property_info, indent=""):
-        if node is not None:
-            property_info.append(f"{indent}{node.name} - {node.category}")
-            for child in node.children:
-                self._view_tree(child, property_info, indent + "  ")
+    def export_tree(self):
+        """Write the whole hierarchy as an indented text outline, one line at a time."""
+        if self.tree.root is None:
+            messagebox.showinfo("Tree Empty", "No properties available.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Property Tree", defaultextension=".txt", filetypes=[("Text files", "*.txt")])
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            for line in iter_outline(self.tree.root, lambda node: f"{node.name} - {node.category}"):
+                file.write(line + "\n")
+        messagebox.showinfo("Tree Exported", f"Property tree written to {path}.")
 
     def clear_inputs(self):
         self.parent_combo.set("")
@@ -144,7 +254,57 @@ class RealEstateApp:
         self.category_combo.set("")
 
 
+def benchmark_bulk_insert(count=1_000_000):
+    """Add properties under parents found by name and report the time per add at each tenfold size."""
+    tree = BinaryTree()
+    names = ["Industry", "Residential", "Commercial", "Retail"]
+    for category in names:
+        tree.add_node(TreeNode(category, "N/A"))
+    checkpoint = 10_000
+    start = time.perf_counter()
+    for i in range(count):
+        parent = tree.find_node(names[random.randrange(len(names))])
+        name = f"Property {i}"
+        tree.add_child(parent, TreeNode(name, "Luxury"))
+        names.append(name)
+        if i + 1 == checkpoint:
+            elapsed = time.perf_counter() - start
+            print(f"{checkpoint} properties added in {elapsed:.2f}s ({elapsed / checkpoint * 1e6:.2f} us per add)")
+            checkpoint *= 10
+
+
+def benchmark_snapshot(count=1_000_000, path="properties_benchmark.snapshot"):
+    """Time a full save and load of a large tree, then an incremental save of a few new properties."""
+    tree = BinaryTree()
+    tree.add_node(TreeNode("Properties", "N/A"))
+    parents = [tree.root]
+    for i in range(count):
+        node = TreeNode(f"Property {i}", "Luxury")
+        tree.add_child(random.choice(parents), node)
+        if i % 100 == 0:
+            parents.append(node)
+    start = time.perf_counter()
+    tree.save(path)
+    print(f"Saved {count} properties in {time.perf_counter() - start:.2f}s ({os.path.getsize(path) / 2**20:.1f} MiB)")
+
+    for i in range(100):
+        tree.add_child(random.choice(parents), TreeNode(f"New {i}", "Standard"))
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    tree.save_changes(path)
+    print(f"Incremental save of 100 properties in {(time.perf_counter() - start) * 1000:.1f}ms ({os.path.getsize(path) - size} bytes)")
+
+    start = time.perf_counter()
+    loaded = BinaryTree.load(path)
+    print(f"Loaded {len(loaded.saved)} properties in {time.perf_counter() - start:.2f}s")
+    os.remove(path)
+
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = RealEstateApp(root)
-    root.mainloop()
+    if "--benchmark" in sys.argv:
+        benchmark_bulk_insert()
+        benchmark_snapshot()
+    else:
+        root = tk.Tk()
+        app = RealEstateApp(root)
+        root.mainloop()
@@ -1,5 +1,52 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+from bisect import insort
+from contextlib import contextmanager
+import heapq
+import itertools
+import os
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # Columnar analytics are optional
+    np = None
+
+from hierarchy_view import HierarchyView, iter_outline
+from tree_snapshot import NO_PARENT, TreeSnapshot
+
+# Lower ranks come first; anything unknown (like "N/A" on parent nodes) ranks last
+SIZE_PRIORITY = {"Large": 1, "Medium": 2, "Small": 3}
+CATEGORY_PRIORITY = {"Luxury": 1, "Standard": 2, "Economy": 3}
+SORT_FIELDS = {
+    "size": lambda node: SIZE_PRIORITY.get(node.size, 4),
+    "value": lambda node: -node.value,  # Higher values first
+    "category": lambda node: CATEGORY_PRIORITY.get(node.category, 4)
+}
+
+
+def make_sort_key(fields):
+    """Build a function that turns a node into a composite key, e.g. fields=("size", "value")."""
+    getters = [SORT_FIELDS[field] for field in fields]
+    return lambda node: tuple(getter(node) for getter in getters)
+
+
+SNAPSHOT = TreeSnapshot(("name", "category", "size"), (("value", "q"), ("priority", "i")))
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "properties7.snapshot")
+
+SORT_ORDERS = {
+    "Size, Value": ("size", "value"),
+    "Value": ("value",),
+    "Category, Size, Value": ("category", "size", "value"),
+    "Category, Value": ("category", "value")
+}
+
+
+def priority_key(node):
+    return node.sort_key
+
 
 # TreeNode Class to represent each node in the tree
 class TreeNode:
@@ -10,68 +57,338 @@ class TreeNode:
         self.value = value  # Property value in monetary terms
         self.priority = priority  # Priority based on size or value
         self.children = []  # A list to store children nodes
-
-    def add_child(self, child_node):
-        self.children.append(child_node)
+        self.branches = []  # The children that have children of their own
+        self.sort_key = (priority,)  # Composite key set by the tree when the node is added
+        self.best = self.sort_key  # Smallest sort key anywhere in this subtree
+        self.parent = None
+        self.path = name  # Names from the root down to this node, joined by "/"
+        self.serial = None  # Position in the snapshot file, once saved
+        # Rollups over the subtree rooted here, this node included
+        self.count = 1
+        self.total_value = value
+        self.category_counts = {category: 1}
+        self.size_counts = {size: 1}
+
+    def add_child(self, child_node, keep_sorted=True):
+        """Attach a child, keeping children in priority order (equal priorities stay in arrival order)."""
+        child_node.parent = self
+        child_node.path = f"{self.path}/{child_node.name}"
+        if not self.children and self.parent is not None:
+            self.parent.branches.append(self)
+        if child_node.children:
+            self.branches.append(child_node)
+        if keep_sorted:
+            insort(self.children, child_node, key=priority_key)
+        else:
+            self.children.append(child_node)
+        # Fold the child's subtree into every ancestor's rollups: O(depth)
+        node = self
+        while node is not None:
+            node.absorb(child_node)
+            node = node.parent
+
+    def absorb(self, subtree):
+        """Add another subtree's rollups into this node's."""
+        self.count += subtree.count
+        self.total_value += subtree.total_value
+        if subtree.best < self.best:
+            self.best = subtree.best
+        for category, count in subtree.category_counts.items():
+            self.category_counts[category] = self.category_counts.get(category, 0) + count
+        for size, count in subtree.size_counts.items():
+            self.size_counts[size] = self.size_counts.get(size, 0) + count
+
+    def rollup(self):
+        """Subtree totals in O(1): property count, total value and counts per category and size."""
+        return {
+            "count": self.count,
+            "total_value": self.total_value,
+            "categories": dict(self.category_counts),
+            "sizes": dict(self.size_counts)
+        }
 
 
 # BinaryTree Class to manage the entire tree structure
 class BinaryTree:
-    def __init__(self):
+    def __init__(self, sort_fields=("size", "value")):
         self.root = None
+        self.sort_fields = tuple(sort_fields)
+        self.key_of = make_sort_key(self.sort_fields)
+        self.by_name = {}  # name -> nodes with that name, in the order they were added
+        self.by_path = {}  # full path -> node
+        self.saved = []  # Nodes written to the snapshot file, by serial number
+        self.unsaved = []  # Nodes added since the last save
+        self.deferring = False
+        self.unsorted = set()  # Parents given children while sorting was deferred
+        self.mirror = None  # Cached PropertyColumns, dropped whenever the tree changes
+
+    def _keyed(self, node):
+        node.sort_key = node.best = self.key_of(node)
+        for child in node.children:
+            node.best = min(node.best, child.best)
+        return node
+
+    def _index(self, node):
+        self.by_name.setdefault(node.name, []).append(node)
+        self.by_path.setdefault(node.path, node)
 
     def add_node(self, new_node):
+        self._keyed(new_node)
         if self.root is None:
             self.root = new_node
         else:
             self._add(self.root, new_node)
+        self._index(new_node)
+        self.unsaved.append(new_node)
+        self.mirror = None
 
     def _add(self, node, new_node):
-        if new_node.name < node.name:
-            if node.children and len(node.children) > 0:
-                self._add(node.children[0], new_node)
-            else:
-                node.add_child(new_node)
-        else:
-            if len(node.children) == 2:
-                self._add(node.children[1], new_node)
-            else:
-                node.add_child(new_node)
+        # Walk down in a loop so long chains of nodes cannot hit the recursion limit
+        while True:
+            if new_node.name < node.name:
+                if node.children:
+                    node = node.children[0]
+                    continue
+            elif len(node.children) == 2:
+                node = node.children[1]
+                continue
+            node.add_child(new_node)
+            return
 
-    def find_node(self, node, name):
+    def add_child(self, parent, new_node):
+        self._keyed(new_node)
+        if self.deferring:
+            parent.add_child(new_node, keep_sorted=False)
+            self.unsorted.add(parent)
+        else:
+            parent.add_child(new_node)
+        self._index(new_node)
+        self.unsaved.append(new_node)
+        self.mirror = None
+
+    @contextmanager
+    def deferred_sorting(self):
+        """Append children unsorted inside the block, then sort each touched parent once on exit."""
+        self.deferring = True
+        try:
+            yield self
+        finally:
+            self.deferring = False
+            for parent in self.unsorted:
+                parent.children.sort(key=priority_key)  # Stable, like the sorted inserts
+            self.unsorted.clear()
+            self.mirror = None
+
+    def find_node(self, name):
+        """Find a node by full path from the root (e.g. "Industry/Residential") or else by name, in O(1).
+
+        When several branches hold the same name, the name lookup returns the
+        one added first; use the full path to pick another.
+        """
+        node = self.by_path.get(name)
         if node is None:
-            return None
-        if node.name == name:
-            return node
-        for child in node.children:
-            found_node = self.find_node(child, name)
-            if found_node:
-                return found_node
-        return None
+            nodes = self.by_name.get(name)
+            node = nodes[0] if nodes else None
+        return node
+
+    def rollup(self, name):
+        """Subtree totals for the node found by name or path, or None if there is no such node."""
+        node = self.find_node(name)
+        return node.rollup() if node is not None else None
 
     def sort_properties_by_priority(self):
-        # Perform Insertion Sort on the root's children based on priority
-        if self.root:
-            self.root.children = self.insertion_sort(self.root.children)
-        for child in self.root.children:
-            self.sort_child_nodes(child)
-
-    def sort_child_nodes(self, node):
-        if node.children:
-            node.children = self.insertion_sort(node.children)
+        """Re-sort every node's children, e.g. after priorities change; adds keep them sorted already."""
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            node.children.sort(key=priority_key)
+            stack.extend(node.children)
+        self.mirror = None
+
+    def save(self, path=SNAPSHOT_PATH):
+        """Write a full snapshot of the tree, replacing any earlier one."""
+        self.saved = SNAPSHOT.save(path, self.root)
+        self.unsaved.clear()
+
+    def save_changes(self, path=SNAPSHOT_PATH):
+        """Append only the subtrees added since the last save, or write a full snapshot if there is none."""
+        if not self.unsaved:
+            return
+        if self.root is None or self.root.serial is None or not os.path.exists(path):
+            self.save(path)
+            return
+        # New nodes under an already saved parent start a subtree; the rest are inside one
+        roots = [node for node in self.unsaved if node.parent.serial is not None]
+        self.saved += SNAPSHOT.append(path, roots, len(self.saved))
+        self.unsaved.clear()
+
+    @classmethod
+    def load(cls, path=SNAPSHOT_PATH, sort_fields=("size", "value")):
+        """Build a tree from a snapshot file: the full tree plus any appended changes."""
+        tree = cls(sort_fields)
+        for parent_serial, nodes in SNAPSHOT.load(path, TreeNode):
+            # Descendants follow a node in pre-order, so walking backwards finishes children first
+            for node in reversed(nodes):
+                node.sort_key = node.best = tree.key_of(node)
+                if node.children:
+                    node.children.sort(key=priority_key)  # Already in order unless the sort fields differ
+                    for child in node.children:
+                        node.absorb(child)
+                        if child.children:
+                            node.branches.append(child)
+            tree._attach_loaded(parent_serial, nodes)
+        return tree
+
+    def _attach_loaded(self, parent_serial, nodes):
+        root = nodes[0]
+        if parent_serial == NO_PARENT:
+            self.root = root
+        else:
+            self.saved[parent_serial].add_child(root)
+        by_name, by_path = self.by_name, self.by_path
+        for serial, node in enumerate(nodes, len(self.saved)):
+            if node is not root:
+                node.path = f"{node.parent.path}/{node.name}"
+            node.serial = serial
+            # Same as _index, inlined since this runs once per loaded node
+            by_name.setdefault(node.name, []).append(node)
+            by_path.setdefault(node.path, node)
+        self.saved += nodes
+
+    def columns(self):
+        """Columnar NumPy mirror of the tree, rebuilt only after the tree has changed."""
+        if self.mirror is None:
+            self.mirror = PropertyColumns(self.root)
+        return self.mirror
+
+    def set_sort_fields(self, fields):
+        """Switch to a new composite key: recompute every node's key once, then re-sort."""
+        self.sort_fields = tuple(fields)
+        self.key_of = make_sort_key(self.sort_fields)
+        order = [self.root] if self.root else []
+        for node in order:  # Breadth-first, so walking it backwards visits children before parents
+            order.extend(node.children)
+        for node in reversed(order):
+            node.sort_key = node.best = self.key_of(node)
             for child in node.children:
-                self.sort_child_nodes(child)
-
-    def insertion_sort(self, nodes):
-        # Insertion Sort algorithm to sort nodes based on priority
-        for i in range(1, len(nodes)):
-            key = nodes[i]
-            j = i - 1
-            while j >= 0 and key.priority < nodes[j].priority:
-                nodes[j + 1] = nodes[j]
-                j -= 1
-            nodes[j + 1] = key
-        return nodes
+                if child.best < node.best:
+                    node.best = child.best
+        self.sort_properties_by_priority()
+
+    def top_k(self, k):
+        """The k best nodes in the whole hierarchy, best first, by a heap-based k-way merge.
+
+        The heap holds three kinds of candidates: a node itself, the subtree
+        under a branch child (keyed by the best key it contains), and a
+        cursor into a parent's sorted children that steps over the leaves in
+        order. Only nodes that can still reach the top k get expanded, so a
+        wide category costs a cursor, not a push per child.
+        """
+        if self.root is None or k <= 0:
+            return []
+        counter = itertools.count()
+        heap = [(self.root.best, next(counter), "subtree", self.root, 0)]
+        result = []
+        while heap and len(result) < k:
+            _, _, kind, node, index = heapq.heappop(heap)
+            if kind == "node":
+                result.append(node)
+            elif kind == "subtree":
+                heapq.heappush(heap, (node.sort_key, next(counter), "node", node, 0))
+                for branch in node.branches:
+                    heapq.heappush(heap, (branch.best, next(counter), "subtree", branch, 0))
+                self._push_leaf(heap, counter, node, 0)
+            else:
+                result.append(node.children[index])
+                self._push_leaf(heap, counter, node, index + 1)
+        return result
+
+    @staticmethod
+    def _push_leaf(heap, counter, parent, index):
+        # Leaves have no subtree beyond themselves, and they are already in key order
+        children = parent.children
+        while index < len(children) and children[index].children:
+            index += 1
+        if index < len(children):
+            heapq.heappush(heap, (children[index].sort_key, next(counter), "leaf", parent, index))
+
+
+class PropertyColumns:
+    """Columnar NumPy mirror of the hierarchy for vectorized filters and group-bys.
+
+    Rows are the nodes in pre-order, so the subtree of row i is rows
+    i to end[i] - 1. Category and size are dictionary-encoded as small
+    integer codes next to an int64 value column and each row's parent row
+    (-1 for the root). The mirror is a snapshot; BinaryTree.columns()
+    rebuilds it after the tree changes.
+    """
+    def __init__(self, root):
+        if np is None:
+            raise RuntimeError("NumPy is required for columnar analytics")
+        self.nodes = []
+        self.categories = {}  # category -> code
+        self.sizes = {}  # size -> code
+        category_codes, size_codes, values, parents = [], [], [], []
+        stack = [(root, -1)] if root is not None else []
+        while stack:
+            node, parent = stack.pop()
+            row = len(self.nodes)
+            self.nodes.append(node)
+            category_codes.append(self.categories.setdefault(node.category, len(self.categories)))
+            size_codes.append(self.sizes.setdefault(node.size, len(self.sizes)))
+            values.append(node.value)
+            parents.append(parent)
+            stack.extend((child, row) for child in reversed(node.children))
+        self.category = np.array(category_codes, dtype=np.int16)
+        self.size = np.array(size_codes, dtype=np.int16)
+        self.value = np.array(values, dtype=np.int64)
+        self.parent = np.array(parents, dtype=np.int64)
+        # The subtree rollup count gives each pre-order interval without another walk
+        self.end = np.arange(len(self.nodes), dtype=np.int64) + np.fromiter((node.count for node in self.nodes), dtype=np.int64, count=len(self.nodes))
+        self.rows = dict(zip(self.nodes, range(len(self.nodes))))  # node -> its row, for subtree lookups
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def span(self, under=None):
+        """The (start, end) rows of the subtree under a node, or of the whole tree."""
+        if under is None:
+            return 0, len(self.nodes)
+        row = self.rows[under]
+        return row, int(self.end[row])
+
+    def mask(self, category=None, size=None, min_value=None, max_value=None, under=None):
+        """Boolean mask over the rows of span(under) for the given criteria."""
+        start, end = self.span(under)
+        mask = np.ones(end - start, dtype=bool)
+        if category is not None:
+            mask &= self.category[start:end] == self.categories.get(category, -1)
+        if size is not None:
+            mask &= self.size[start:end] == self.sizes.get(size, -1)
+        if min_value is not None:
+            mask &= self.value[start:end] >= min_value
+        if max_value is not None:
+            mask &= self.value[start:end] <= max_value
+        return mask
+
+    def select(self, under=None, **criteria):
+        """Row numbers matching the criteria of mask(), in pre-order."""
+        return np.flatnonzero(self.mask(under=under, **criteria)) + self.span(under)[0]
+
+    def filter(self, **criteria):
+        """Nodes matching the criteria of mask(), in pre-order."""
+        return [self.nodes[row] for row in self.select(**criteria)]
+
+    def sum_by_category(self, under=None):
+        """Total value per category, over the whole tree or one subtree."""
+        start, end = self.span(under)
+        codes, values = self.category[start:end], self.value[start:end]
+        return {category: int(values[codes == code].sum()) for category, code in self.categories.items()}
+
+    def count_by_category(self, under=None):
+        start, end = self.span(under)
+        counts = np.bincount(self.category[start:end], minlength=len(self.categories))
+        return {category: int(counts[code]) for category, code in self.categories.items()}
 
 
 # Application Class to create the GUI
@@ -82,7 +399,8 @@ class RealEstateApp:
         self.root.geometry("800x600")
         self.root.state("zoomed")
         self.root.resizable(True, True)
-        self.tree = BinaryTree()
+        self.tree = self.load_tree()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # UI Elements
         self.create_ui()
@@ -125,16 +443,86 @@ class RealEstateApp:
         view_frame = ttk.LabelFrame(self.root, text="View Property Tree", width=800, height=150)
         view_frame.grid(row=1, column=0, padx=20, pady=20, sticky="nsew")
 
-        self.property_list = tk.Text(view_frame, height=5, width=80, font=("Arial", 12))
-        self.property_list.grid(row=0, column=0, padx=20, pady=10)
+        # Children are loaded only when their parent row is expanded
+        self.property_tree = ttk.Treeview(view_frame, columns=("Category", "Size", "Value", "Priority", "Subtree"), height=5)
+        self.property_tree.heading("#0", text="Property")
+        for column in ("Category", "Size", "Value", "Priority", "Subtree"):
+            self.property_tree.heading(column, text=column)
+        self.property_tree.grid(row=0, column=0, padx=20, pady=10, sticky="nsew")
+        scrollbar = ttk.Scrollbar(view_frame, orient="vertical", command=self.property_tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.property_tree.configure(yscrollcommand=scrollbar.set)
+        self.hierarchy = HierarchyView(self.property_tree, self.node_values)
 
         # View Property Tree button
         view_button = ttk.Button(view_frame, text="View Property Tree", command=self.view_tree)
         view_button.grid(row=1, column=0, pady=10, sticky="ew")
 
+        export_button = ttk.Button(view_frame, text="Export Tree", command=self.export_tree)
+        export_button.grid(row=2, column=0, pady=10, sticky="ew")
+
+        save_button = ttk.Button(view_frame, text="Save Snapshot", command=self.save_snapshot)
+        save_button.grid(row=7, column=0, pady=10, sticky="ew")
+
+        self.show_totals = tk.BooleanVar(value=False)
+        totals_check = ttk.Checkbutton(view_frame, text="Show subtree totals", variable=self.show_totals)
+        totals_check.grid(row=3, column=0, pady=5, sticky="w")
+
+        # Sort order for siblings and the top properties list
+        sort_frame = ttk.Frame(view_frame)
+        sort_frame.grid(row=4, column=0, pady=5, sticky="ew")
+        ttk.Label(sort_frame, text="Sort by:").pack(side="left")
+        self.sort_combo = ttk.Combobox(sort_frame, values=list(SORT_ORDERS), state="readonly")
+        self.sort_combo.set("Size, Value")
+        self.sort_combo.bind("<<ComboboxSelected>>", self.change_sort_order)
+        self.sort_combo.pack(side="left", padx=10)
+        top_button = ttk.Button(sort_frame, text="Show Top 20", command=self.show_top_properties)
+        top_button.pack(side="left", padx=10)
+
+        # Vectorized filters over the columnar mirror (needs NumPy)
+        filter_frame = ttk.Frame(view_frame)
+        filter_frame.grid(row=5, column=0, pady=5, sticky="ew")
+        ttk.Label(filter_frame, text="Filter:").pack(side="left")
+        self.filter_category = ttk.Combobox(filter_frame, values=["", "Luxury", "Standard", "Economy"], width=10)
+        self.filter_category.pack(side="left", padx=5)
+        self.filter_size = ttk.Combobox(filter_frame, values=["", "Small", "Medium", "Large"], width=10)
+        self.filter_size.pack(side="left", padx=5)
+        ttk.Label(filter_frame, text="Value from").pack(side="left")
+        self.filter_min = ttk.Entry(filter_frame, width=12)
+        self.filter_min.pack(side="left", padx=5)
+        ttk.Label(filter_frame, text="to").pack(side="left")
+        self.filter_max = ttk.Entry(filter_frame, width=12)
+        self.filter_max.pack(side="left", padx=5)
+        ttk.Label(filter_frame, text="Under").pack(side="left")
+        self.filter_under = ttk.Entry(filter_frame, width=15)
+        self.filter_under.pack(side="left", padx=5)
+        filter_button = ttk.Button(filter_frame, text="Filter", command=self.filter_properties)
+        filter_button.pack(side="left", padx=10)
+        self.filter_label = ttk.Label(view_frame)
+        self.filter_label.grid(row=6, column=0, sticky="w")
+
         # View Tree Button with a shortcut key (Alt + V)
         self.root.bind("<Alt-v>", self.view_tree)
 
+    def load_tree(self):
+        """Restore the properties saved by the last session, if any."""
+        if not os.path.exists(SNAPSHOT_PATH):
+            return BinaryTree()
+        try:
+            return BinaryTree.load(SNAPSHOT_PATH)
+        except ValueError as error:
+            messagebox.showerror("Snapshot Error", f"Could not load saved properties: {error}")
+            return BinaryTree()
+
+    def save_snapshot(self):
+        """Write a full snapshot, folding in every incremental save made so far."""
+        self.tree.save(SNAPSHOT_PATH)
+        messagebox.showinfo("Snapshot Saved", f"Property tree saved to {SNAPSHOT_PATH}.")
+
+    def on_close(self):
+        self.tree.save_changes(SNAPSHOT_PATH)  # Only the properties added this session
+        self.root.destroy()
+
     def add_property(self):
         parent_name = self.parent_combo.get().strip()
         name = self.name_entry.get().strip()
@@ -146,20 +534,16 @@ class RealEstateApp:
             messagebox.showerror("Input Error", "Please provide valid property details.")
             return
 
-        # Set priority based on Property Size (Size -> Large > Medium > Small)
-        size_priority = {"Large": 1, "Medium": 2, "Small": 3}
-
-        # Convert value to an integer and set priority based on size first
-        size_priority_value = size_priority.get(size, 4)
+        # Priority shown for the property is its size rank (Large > Medium > Small);
+        # siblings are ordered by the tree's composite sort key, size then value by default
+        priority = SIZE_PRIORITY.get(size, 4)
         value = int(value)  # Convert value to integer
-        priority = size_priority_value  # Here we use size priority, can include value as secondary factor
 
         # Check if the parent exists
-        parent_node = self.tree.find_node(self.tree.root, parent_name)
+        parent_node = self.tree.find_node(parent_name)
         if parent_node:
             new_property = TreeNode(name, category, size, value, priority)
-            parent_node.add_child(new_property)
-            self.tree.sort_properties_by_priority()  # Sort after adding
+            self.tree.add_child(parent_node, new_property)  # Inserted in priority order
             messagebox.showinfo("Property Added", f"Property '{name}' added under {parent_name} ({category}).")
             self.clear_inputs()
         else:
@@ -177,16 +561,74 @@ class RealEstateApp:
             messagebox.showinfo("Tree Empty", "No properties available.")
             return
 
-        property_info = []
-        self._view_tree(self.tree.root, property_info)
-        self.property_list.delete(1.0, tk.END)
-        self.property_list.insert(tk.END, "\n".join(property_info))
+        self.hierarchy.load(self.tree.root)
 
-    def _view_tree(self, node, property_info, indent=""):
-        if node is not None:
-            property_info.append(f"{indent}{node.name} - {node.category} (Size: {node.size}, Value: {node.value} FRW, Priority: {node.priority})")
-            for child in node.children:
-                self._view_tree(child, property_info, indent + "  ")
+    def change_sort_order(self, event=None):
+        self.tree.set_sort_fields(SORT_ORDERS[self.sort_combo.get()])
+        if self.tree.root is not None:
+            self.view_tree()
+
+    def show_top_properties(self):
+        if self.tree.root is None:
+            messagebox.showinfo("Tree Empty", "No properties available.")
+            return
+        self.hierarchy.load_nodes(self.tree.top_k(20))
+
+    def filter_properties(self):
+        if np is None:
+            messagebox.showerror("NumPy Required", "Install NumPy to filter properties.")
+            return
+        if self.tree.root is None:
+            messagebox.showinfo("Tree Empty", "No properties available.")
+            return
+        low, high = self.filter_min.get().strip(), self.filter_max.get().strip()
+        if (low and not low.isdigit()) or (high and not high.isdigit()):
+            messagebox.showerror("Input Error", "Values must be whole numbers.")
+            return
+        under = None
+        if self.filter_under.get().strip():
+            under = self.tree.find_node(self.filter_under.get().strip())
+            if under is None:
+                messagebox.showerror("Not Found", f"No property named '{self.filter_under.get().strip()}'.")
+                return
+        columns = self.tree.columns()
+        matches = columns.filter(
+            category=self.filter_category.get() or None,
+            size=self.filter_size.get() or None,
+            min_value=int(low) if low else None,
+            max_value=int(high) if high else None,
+            under=under
+        )
+        totals = ", ".join(f"{category}: {total} FRW" for category, total in columns.sum_by_category(under).items())
+        self.filter_label.config(text=f"{len(matches)} matches (showing up to 1000). Totals by category: {totals}")
+        self.hierarchy.load_nodes(matches[:1000])
+
+    def subtree_summary(self, node):
+        if not self.show_totals.get() or not node.children:
+            return ""
+        categories = ", ".join(f"{category}: {count}" for category, count in node.category_counts.items())
+        return f"{node.count} properties, {node.total_value} FRW; {categories}"
+
+    def node_values(self, node):
+        return (node.category, node.size, node.value, node.priority, self.subtree_summary(node))
+
+    def describe_node(self, node):
+        line = f"{node.name} - {node.category} (Size: {node.size}, Value: {node.value} FRW, Priority: {node.priority})"
+        summary = self.subtree_summary(node)
+        return f"{line} [Subtree: {summary}]" if summary else line
+
+    def export_tree(self):
+        """Write the whole hierarchy as an indented text outline, one line at a time."""
+        if self.tree.root is None:
+            messagebox.showinfo("Tree Empty", "No properties available.")
+            return
+        path = filedialog.asksaveasfilename(title="Export Property Tree", defaultextension=".txt", filetypes=[("Text files", "*.txt")])
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            for line in iter_outline(self.tree.root, self.describe_node):
+                file.write(line + "\n")
+        messagebox.showinfo("Tree Exported", f"Property tree written to {path}.")
 
     def clear_inputs(self):
         self.parent_combo.set("")
@@ -196,7 +638,146 @@ class RealEstateApp:
         self.value_entry.delete(0, tk.END)
 
 
+def benchmark_bulk_insert(count=1_000_000):
+    """Add properties under parents found by name and report the time per add at each tenfold size."""
+    tree = BinaryTree()
+    names = ["Industry", "Residential", "Commercial", "Retail"]
+    for category in names:
+        tree.add_node(TreeNode(category, "N/A", "N/A", 0, 4))
+    checkpoint = 10_000
+    start = time.perf_counter()
+    for i in range(count):
+        parent = tree.find_node(names[random.randrange(len(names))])
+        name = f"Property {i}"
+        tree.add_child(parent, TreeNode(name, "Luxury", "Large", i, 1))
+        names.append(name)
+        if i + 1 == checkpoint:
+            elapsed = time.perf_counter() - start
+            print(f"{checkpoint} properties added in {elapsed:.2f}s ({elapsed / checkpoint * 1e6:.2f} us per add)")
+            checkpoint *= 10
+
+
+def benchmark_sorted_children(sizes=(10_000, 100_000, 1_000_000), adds=10_000):
+    """Time single sorted adds into trees of growing size, then one deferred bulk add."""
+    for size in sizes:
+        tree = BinaryTree()
+        tree.add_node(TreeNode("Properties", "N/A", "N/A", 0, 4))
+        parents = [tree.root]
+        with tree.deferred_sorting():
+            for i in range(size):
+                node = TreeNode(f"Property {i}", "Luxury", "Large", i, random.randint(1, 3))
+                tree.add_child(random.choice(parents), node)
+                parents.append(node)
+        start = time.perf_counter()
+        for i in range(adds):
+            tree.add_child(random.choice(parents), TreeNode(f"New {i}", "Standard", "Small", i, random.randint(1, 3)))
+        elapsed = time.perf_counter() - start
+        print(f"Tree of {size} properties: {elapsed / adds * 1e6:.2f} us per sorted add")
+
+    tree = BinaryTree()
+    tree.add_node(TreeNode("Properties", "N/A", "N/A", 0, 4))
+    start = time.perf_counter()
+    with tree.deferred_sorting():
+        for i in range(sizes[-1]):
+            tree.add_child(tree.root, TreeNode(f"Property {i}", "Luxury", "Large", i, random.randint(1, 3)))
+    print(f"Deferred bulk add of {sizes[-1]} children under one parent in {time.perf_counter() - start:.2f}s")
+
+
+def benchmark_top_k(count=1_000_000, k=20):
+    """Compare top_k with sorting every node, on a tree with a few wide categories."""
+    tree = BinaryTree()
+    for category in ("Industry", "Residential", "Commercial", "Retail"):
+        tree.add_node(TreeNode(category, "N/A", "N/A", 0, 4))
+    parents = list(tree.by_path.values())
+    with tree.deferred_sorting():
+        for i in range(count):
+            size = random.choice(("Small", "Medium", "Large"))
+            node = TreeNode(f"Property {i}", random.choice(("Luxury", "Standard", "Economy")), size, random.randrange(10**9), SIZE_PRIORITY[size])
+            tree.add_child(random.choice(parents) if i % 100 else parents[i % 4], node)
+            if i % 1000 == 0:
+                parents.append(node)
+    start = time.perf_counter()
+    top = tree.top_k(k)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    everything = sorted(iter_nodes(tree.root), key=priority_key)[:k]
+    print(f"top_k({k}) over {count} properties in {elapsed * 1000:.2f}ms (full sort {time.perf_counter() - start:.2f}s, same result: {top == everything})")
+
+
+def iter_nodes(root):
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children)
+
+
+def benchmark_columns(count=1_000_000, repeats=20):
+    """Time building the NumPy mirror, then filters and group-by sums over it."""
+    if np is None:
+        print("NumPy is not installed; skipping the columnar benchmark")
+        return
+    tree = BinaryTree()
+    for category in ("Industry", "Residential", "Commercial", "Retail"):
+        tree.add_node(TreeNode(category, "N/A", "N/A", 0, 4))
+    parents = list(tree.by_path.values())
+    with tree.deferred_sorting():
+        for i in range(count):
+            size = random.choice(("Small", "Medium", "Large"))
+            node = TreeNode(f"Property {i}", random.choice(("Luxury", "Standard", "Economy")), size, random.randrange(10**9), SIZE_PRIORITY[size])
+            tree.add_child(random.choice(parents), node)
+            if i % 100 == 0:
+                parents.append(node)
+    start = time.perf_counter()
+    columns = tree.columns()
+    print(f"Columnar mirror of {len(columns)} nodes built in {time.perf_counter() - start:.2f}s")
+
+    under = tree.find_node("Residential")
+    start = time.perf_counter()
+    for _ in range(repeats):
+        mask = columns.mask(category="Luxury", size="Large", min_value=2 * 10**8, max_value=6 * 10**8, under=under)
+    print(f"Filter: {int(mask.sum())} matches in {(time.perf_counter() - start) / repeats * 1000:.2f}ms")
+    start = time.perf_counter()
+    for _ in range(repeats):
+        columns.sum_by_category()
+    print(f"Sum by category in {(time.perf_counter() - start) / repeats * 1000:.2f}ms")
+
+
+def benchmark_snapshot(count=1_000_000, path="properties_benchmark.snapshot"):
+    """Time a full save and load of a large tree, then an incremental save of a few new properties."""
+    tree = BinaryTree()
+    tree.add_node(TreeNode("Properties", "N/A", "N/A", 0, 4))
+    parents = [tree.root]
+    for i in range(count):
+        node = TreeNode(f"Property {i}", "Luxury", "Large", i, random.randint(1, 3))
+        tree.add_child(random.choice(parents), node)
+        if i % 100 == 0:
+            parents.append(node)
+    start = time.perf_counter()
+    tree.save(path)
+    print(f"Saved {count} properties in {time.perf_counter() - start:.2f}s ({os.path.getsize(path) / 2**20:.1f} MiB)")
+
+    for i in range(100):
+        tree.add_child(random.choice(parents), TreeNode(f"New {i}", "Standard", "Small", i, 2))
+    size = os.path.getsize(path)
+    start = time.perf_counter()
+    tree.save_changes(path)
+    print(f"Incremental save of 100 properties in {(time.perf_counter() - start) * 1000:.1f}ms ({os.path.getsize(path) - size} bytes)")
+
+    start = time.perf_counter()
+    loaded = BinaryTree.load(path)
+    print(f"Loaded {len(loaded.saved)} properties in {time.perf_counter() - start:.2f}s")
+    os.remove(path)
+
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = RealEstateApp(root)
-    root.mainloop()
+    if "--benchmark" in sys.argv:
+        benchmark_bulk_insert()
+        benchmark_sorted_children()
+        benchmark_top_k()
+        benchmark_columns()
+        benchmark_snapshot()
+    else:
+        root = tk.Tk()
+        app = RealEstateApp(root)
+        root.mainloop()
@@ -0,0 +1,77 @@
+import itertools
+
+
+class HierarchyView:
+    """Shared adapter that shows a tree of nodes in a ttk.Treeview, loading children on expand.
+
+    Nodes need `name` and `children`; `values` maps a node to its column
+    values. Only the root row is inserted when a hierarchy is loaded. A node
+    with children gets a placeholder row, which is swapped for its first
+    page of children when the node is opened; a "Show more" row fetches the
+    next page. The view is a snapshot: call load again to pick up changes.
+    """
+    def __init__(self, tree, values, page_size=500):
+        self.tree = tree
+        self.values = values
+        self.page_size = page_size
+        self.nodes = {}  # Treeview item id -> node
+        self.unloaded = {}  # Placeholder or "Show more" item id -> (node, index of its next child to load)
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def load(self, root):
+        self.clear()
+        if root is not None:
+            self._insert("", root)
+
+    def load_nodes(self, nodes):
+        """Show a flat list of nodes, such as search results; each row can still be expanded."""
+        self.clear()
+        for node in nodes:
+            self._insert("", node)
+
+    def clear(self):
+        self.tree.delete(*self.tree.get_children())
+        self.nodes.clear()
+        self.unloaded.clear()
+
+    def _insert(self, parent_item, node):
+        item = self.tree.insert(parent_item, "end", text=node.name, values=self.values(node))
+        self.nodes[item] = node
+        if node.children:
+            placeholder = self.tree.insert(item, "end", text="Loading...")
+            self.unloaded[placeholder] = (node, 0)
+        return item
+
+    def _load_page(self, marker):
+        """Replace a placeholder or "Show more" row with the next page of children."""
+        node, start = self.unloaded.pop(marker)
+        parent_item = self.tree.parent(marker)
+        self.tree.delete(marker)
+        end = min(start + self.page_size, len(node.children))
+        for child in itertools.islice(node.children, start, end):
+            self._insert(parent_item, child)
+        if end < len(node.children):
+            more = self.tree.insert(parent_item, "end", text=f"Show more ({len(node.children) - end} left)")
+            self.unloaded[more] = (node, end)
+
+    def _on_open(self, event=None):
+        children = self.tree.get_children(self.tree.focus())
+        if len(children) == 1 and children[0] in self.unloaded:
+            self._load_page(children[0])
+
+    def _on_select(self, event=None):
+        for item in self.tree.selection():
+            if item in self.unloaded:
+                self._load_page(item)
+
+
+def iter_outline(root, describe, indent="  "):
+    """Yield one indented line per node in pre-order, using an explicit stack instead of recursion."""
+    if root is None:
+        return
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        yield indent * depth + describe(node)
+        stack.extend((child, depth + 1) for child in reversed(node.children))
@@ -0,0 +1,363 @@
+import itertools
+import mmap
+import os
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+
+PAGE_SIZE = 4096
+MAGIC = b"ORDBPT01"
+
+# Page 0: magic, page size, root page, page count, current record page, order count
+HEADER = struct.Struct("<8sIIIIQ")
+# Every other page starts with: kind, entry count (or bytes used), next leaf page
+PAGE_HEADER = struct.Struct("<BHI")
+PAGE_HEADER_SIZE = 8
+LEAF_ENTRY = struct.Struct("<qqIHH")  # price, order_id, record page, record offset, record length
+KEY = struct.Struct("<qq")  # price, order_id
+CHILD = struct.Struct("<I")
+FIELD_LENGTH = struct.Struct("<H")
+
+LEAF, INTERNAL, RECORDS = 1, 2, 3
+NO_PAGE = 0  # Page 0 is the header, so it never appears as a link
+LEAF_CAPACITY = (PAGE_SIZE - PAGE_HEADER_SIZE) // LEAF_ENTRY.size
+INTERNAL_CAPACITY = (PAGE_SIZE - PAGE_HEADER_SIZE - CHILD.size) // (KEY.size + CHILD.size)
+LOWEST = -(1 << 63)
+
+OrderRecord = namedtuple("OrderRecord", "order_id name phone property_details price")
+
+
+class _Leaf:
+    __slots__ = ("keys", "refs", "next")
+
+    def __init__(self, keys=None, refs=None, next_leaf=NO_PAGE):
+        self.keys = keys if keys is not None else []  # (price, order_id), sorted
+        self.refs = refs if refs is not None else []  # (record page, offset, length)
+        self.next = next_leaf
+
+
+class _Internal:
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        self.keys = keys  # Separator i is the smallest key under children[i + 1]
+        self.children = children
+
+
+class _Records:
+    __slots__ = ("data", "used")
+
+    def __init__(self, data=None, used=PAGE_HEADER_SIZE):
+        self.data = data if data is not None else bytearray(PAGE_SIZE)
+        self.used = used
+
+
+class OrderBTree:
+    """Disk-backed B+tree of orders keyed by (price, order_id).
+
+    Everything lives in one file of fixed-size pages: a header page, leaf
+    pages (sorted keys plus pointers to the order text, linked left to
+    right for range scans), internal pages and record pages holding the
+    name/phone/details text. Pages are read through mmap and kept decoded
+    in an LRU cache of `cache_pages` pages; changed pages are written back
+    when evicted or on flush(). Opening only reads the header, so a large
+    file opens instantly.
+
+    It offers the same insert/traversal interface as BinaryTree, so the
+    order window can use it as a backend.
+    """
+    def __init__(self, path, cache_pages=256):
+        self.path = path
+        self.cache_pages = max(cache_pages, 8)
+        self.cache = OrderedDict()  # page number -> decoded page, least recently used first
+        self.dirty = set()
+        self.map = None
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        # Unbuffered, so pages written back are visible through the mmap at once
+        self.file = open(path, "r+b" if exists else "w+b", buffering=0)
+        if exists:
+            magic, page_size, self.root, self.page_count, self.record_page, self.count = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC or page_size != PAGE_SIZE:
+                raise ValueError(f"{path} is not an order B+tree file")
+        else:
+            self.root, self.record_page, self.page_count, self.count = 1, 2, 3, 0
+            self._put(self.root, _Leaf())
+            self._put(self.record_page, _Records())
+            self.flush()
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Page cache
+
+    def _page_bytes(self, page_no):
+        end = (page_no + 1) * PAGE_SIZE
+        if self.map is None or end > len(self.map):
+            if self.map is not None:
+                self.map.close()
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.map[page_no * PAGE_SIZE:end]
+
+    def _decode(self, raw):
+        kind, count, next_leaf = PAGE_HEADER.unpack_from(raw)
+        if kind == LEAF:
+            keys, refs = [], []
+            for offset in range(PAGE_HEADER_SIZE, PAGE_HEADER_SIZE + count * LEAF_ENTRY.size, LEAF_ENTRY.size):
+                price, order_id, page, start, length = LEAF_ENTRY.unpack_from(raw, offset)
+                keys.append((price, order_id))
+                refs.append((page, start, length))
+            return _Leaf(keys, refs, next_leaf)
+        if kind == INTERNAL:
+            keys = [KEY.unpack_from(raw, PAGE_HEADER_SIZE + i * KEY.size) for i in range(count)]
+            base = PAGE_HEADER_SIZE + INTERNAL_CAPACITY * KEY.size
+            children = [CHILD.unpack_from(raw, base + i * CHILD.size)[0] for i in range(count + 1)]
+            return _Internal(keys, children)
+        return _Records(bytearray(raw), count)
+
+    def _encode(self, page):
+        if isinstance(page, _Records):
+            PAGE_HEADER.pack_into(page.data, 0, RECORDS, page.used, NO_PAGE)
+            return bytes(page.data)
+        raw = bytearray(PAGE_SIZE)
+        if isinstance(page, _Leaf):
+            PAGE_HEADER.pack_into(raw, 0, LEAF, len(page.keys), page.next)
+            offset = PAGE_HEADER_SIZE
+            for (price, order_id), (record_page, start, length) in zip(page.keys, page.refs):
+                LEAF_ENTRY.pack_into(raw, offset, price, order_id, record_page, start, length)
+                offset += LEAF_ENTRY.size
+        else:
+            PAGE_HEADER.pack_into(raw, 0, INTERNAL, len(page.keys), NO_PAGE)
+            for i, (price, order_id) in enumerate(page.keys):
+                KEY.pack_into(raw, PAGE_HEADER_SIZE + i * KEY.size, price, order_id)
+            base = PAGE_HEADER_SIZE + INTERNAL_CAPACITY * KEY.size
+            for i, child in enumerate(page.children):
+                CHILD.pack_into(raw, base + i * CHILD.size, child)
+        return bytes(raw)
+
+    def _write(self, page_no, page):
+        self.file.seek(page_no * PAGE_SIZE)
+        self.file.write(self._encode(page))
+
+    def _evict(self):
+        while len(self.cache) > self.cache_pages:
+            page_no, page = self.cache.popitem(last=False)
+            if page_no in self.dirty:
+                self._write(page_no, page)
+                self.dirty.discard(page_no)
+
+    def _get(self, page_no):
+        page = self.cache.get(page_no)
+        if page is not None:
+            self.cache.move_to_end(page_no)
+            return page
+        page = self._decode(self._page_bytes(page_no))
+        self.cache[page_no] = page
+        self._evict()
+        return page
+
+    def _put(self, page_no, page):
+        """Record that a page changed; call after every modification."""
+        self.cache[page_no] = page
+        self.cache.move_to_end(page_no)
+        self.dirty.add(page_no)
+        self._evict()
+
+    def _allocate(self):
+        page_no = self.page_count
+        self.page_count += 1
+        return page_no
+
+    def flush(self):
+        """Write changed pages and the header, then fsync the file."""
+        for page_no in sorted(self.dirty):
+            self._write(page_no, self.cache[page_no])
+        self.dirty.clear()
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, PAGE_SIZE, self.root, self.page_count, self.record_page, self.count).ljust(PAGE_SIZE, b"\0"))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    # Order text
+
+    def _store_record(self, name, phone, property_details):
+        data = b"".join(FIELD_LENGTH.pack(len(field)) + field for field in (text.encode("utf-8") for text in (name, phone, property_details)))
+        if len(data) > PAGE_SIZE - PAGE_HEADER_SIZE:
+            raise ValueError("Order details are too long to store")
+        page = self._get(self.record_page)
+        if page.used + len(data) > PAGE_SIZE:
+            self.record_page = self._allocate()
+            page = _Records()
+        start = page.used
+        page.data[start:start + len(data)] = data
+        page.used += len(data)
+        self._put(self.record_page, page)
+        return self.record_page, start, len(data)
+
+    def _load_record(self, key, ref):
+        record_page, start, length = ref
+        data = self._get(record_page).data
+        fields = []
+        offset = start
+        for _ in range(3):
+            (size,) = FIELD_LENGTH.unpack_from(data, offset)
+            fields.append(bytes(data[offset + 2:offset + 2 + size]).decode("utf-8"))
+            offset += 2 + size
+        return OrderRecord(key[1], fields[0], fields[1], fields[2], key[0])
+
+    # Tree operations
+
+    def _find_leaf(self, key):
+        """Descend to the leaf that should hold key; returns the path of (page, index) pairs and the leaf."""
+        path = []
+        page_no = self.root
+        page = self._get(page_no)
+        while isinstance(page, _Internal):
+            index = bisect_right(page.keys, key)
+            path.append((page_no, index))
+            page_no = page.children[index]
+            page = self._get(page_no)
+        return path, page_no, page
+
+    def insert(self, order_id, name, phone, property_details, price):
+        key = (price, order_id)
+        ref = self._store_record(name, phone, property_details)
+        path, leaf_no, leaf = self._find_leaf(key)
+        index = bisect_right(leaf.keys, key)
+        leaf.keys.insert(index, key)
+        leaf.refs.insert(index, ref)
+        self.count += 1
+        if len(leaf.keys) <= LEAF_CAPACITY:
+            self._put(leaf_no, leaf)
+            return
+
+        # Split the leaf and push the separator up, splitting parents as needed
+        middle = len(leaf.keys) // 2
+        right_no = self._allocate()
+        right = _Leaf(leaf.keys[middle:], leaf.refs[middle:], leaf.next)
+        del leaf.keys[middle:], leaf.refs[middle:]
+        leaf.next = right_no
+        self._put(leaf_no, leaf)
+        self._put(right_no, right)
+        separator, new_child = right.keys[0], right_no
+
+        while path:
+            parent_no, index = path.pop()
+            parent = self._get(parent_no)
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, new_child)
+            if len(parent.keys) <= INTERNAL_CAPACITY:
+                self._put(parent_no, parent)
+                return
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]
+            new_child = self._allocate()
+            right = _Internal(parent.keys[middle + 1:], parent.children[middle + 1:])
+            del parent.keys[middle:], parent.children[middle + 1:]
+            self._put(parent_no, parent)
+            self._put(new_child, right)
+
+        new_root = self._allocate()
+        self._put(new_root, _Internal([separator], [self.root, new_child]))
+        self.root = new_root
+
+    def bulk_load(self, orders, presorted=False):
+        """Insert many (order_id, name, phone, property_details, price) orders; returns how many."""
+        loaded = 0
+        for order in (orders if presorted else sorted(orders, key=lambda order: (order[4], order[0]))):
+            self.insert(*order)
+            loaded += 1
+        return loaded
+
+    def iter_orders(self, start_price=None, after=None):
+        """Lazily yield OrderRecords in (price, order_id) order by walking the leaf chain.
+
+        start_price begins at the first order at or above that price; after
+        resumes just past an order given as a record or (price, order_id).
+        """
+        if after is not None:
+            key = (after.price, after.order_id) if isinstance(after, OrderRecord) else tuple(after)
+            _, _, leaf = self._find_leaf(key)
+            index = bisect_right(leaf.keys, key)
+        else:
+            key = (LOWEST if start_price is None else start_price, LOWEST)
+            _, _, leaf = self._find_leaf(key)
+            index = bisect_left(leaf.keys, key)
+        while True:
+            keys, refs = leaf.keys, leaf.refs
+            for i in range(index, len(keys)):
+                yield self._load_record(keys[i], refs[i])
+            if leaf.next == NO_PAGE:
+                return
+            leaf = self._get(leaf.next)
+            index = 0
+
+    iter_nodes = iter_orders
+
+    def page(self, size, start_price=None, after=None):
+        return list(itertools.islice(self.iter_orders(start_price, after), size))
+
+    def range_orders(self, low, high):
+        """Orders with low <= price <= high, stopping at the first one past high."""
+        for order in self.iter_orders(start_price=low):
+            if order.price > high:
+                return
+            yield order
+
+    def _range_keys(self, low, high):
+        # Scans keys only, without reading any order text
+        key = (low, LOWEST)
+        _, _, leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        while True:
+            for price, _ in itertools.islice(leaf.keys, index, None):
+                if price > high:
+                    return
+                yield price
+            if leaf.next == NO_PAGE:
+                return
+            leaf = self._get(leaf.next)
+            index = 0
+
+    def count_range(self, low, high):
+        """Number of orders with low <= price <= high (O(k) key scan)."""
+        return sum(1 for _ in self._range_keys(low, high))
+
+    def sum_range(self, low, high):
+        return sum(self._range_keys(low, high))
+
+    def kth_smallest(self, k):
+        """The k-th cheapest order (k = 1 is the cheapest), skipping whole leaves."""
+        if not 1 <= k <= self.count:
+            return None
+        _, _, leaf = self._find_leaf((LOWEST, LOWEST))
+        while k > len(leaf.keys):
+            k -= len(leaf.keys)
+            leaf = self._get(leaf.next)
+        return self._load_record(leaf.keys[k - 1], leaf.refs[k - 1])
+
+    def median(self):
+        if not self.count:
+            return None
+        middle = self.kth_smallest((self.count + 1) // 2).price
+        if self.count % 2:
+            return middle
+        return (middle + self.kth_smallest(self.count // 2 + 1).price) / 2
+
+    def inorder_traversal(self):
+        """Fetch all orders as dicts, like BinaryTree.inorder_traversal."""
+        return [order._asdict() for order in self.iter_orders()]
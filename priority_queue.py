@@ -0,0 +1,137 @@
+import heapq
+
+
+class IndexedPriorityQueue:
+    """Binary min-heap of items addressable by request id.
+
+    Lower priority values are served first and items with equal priority
+    come out in arrival order. A request id -> heap position index lets
+    change_priority and cancel run in O(log n) instead of searching the heap.
+    """
+    URGENT, HIGH, NORMAL, LOW = 0, 1, 2, 3
+    LEVELS = {"Urgent": URGENT, "High": HIGH, "Normal": NORMAL, "Low": LOW}
+
+    def __init__(self):
+        # Entries are [priority, sequence, request_id, item]; sequence is unique,
+        # so entries compare on (priority, sequence) and never reach the item
+        self.heap = []
+        self.position = {}  # request_id -> index of its entry in the heap
+        self.next_id = 1
+        self.sequence = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, request_id):
+        return request_id in self.position
+
+    def __iter__(self):
+        """Yield queued items in the order they would be served."""
+        for _, item in self.ordered():
+            yield item
+
+    def ordered(self):
+        """Lazily yield (request_id, item) in service order from a copy of the heap."""
+        heap = [tuple(entry) for entry in self.heap]  # Already a valid heapq heap
+        while heap:
+            _, _, request_id, item = heapq.heappop(heap)
+            yield request_id, item
+
+    def arrival_order(self):
+        """Return the queued items in the order they were pushed, whatever their priority."""
+        return [entry[3] for entry in sorted(self.heap, key=lambda entry: entry[1])]
+
+    def push(self, item, priority=NORMAL, request_id=None):
+        """Queue an item and return its request id."""
+        if request_id is None:
+            request_id = self.next_id
+        elif request_id in self.position:
+            raise KeyError(f"Request {request_id} is already queued")
+        self.next_id = max(self.next_id, request_id + 1)
+        self.sequence += 1
+        self.heap.append([priority, self.sequence, request_id, item])
+        self.position[request_id] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        return request_id
+
+    def pop(self):
+        """Remove and return (request_id, item) with the best priority."""
+        if not self.heap:
+            raise IndexError("pop from an empty priority queue")
+        return self._remove_at(0)
+
+    def peek(self):
+        if not self.heap:
+            return None
+        entry = self.heap[0]
+        return entry[2], entry[3]
+
+    def get(self, request_id):
+        return self.heap[self.position[request_id]][3]
+
+    def priority_of(self, request_id):
+        return self.heap[self.position[request_id]][0]
+
+    def change_priority(self, request_id, priority):
+        """Raise or lower a queued request's priority in O(log n)."""
+        index = self.position[request_id]
+        old = self.heap[index][0]
+        self.heap[index][0] = priority
+        if priority < old:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def cancel(self, request_id):
+        """Remove a specific queued request and return its item."""
+        return self._remove_at(self.position[request_id])[1]
+
+    def clear(self):
+        self.heap.clear()
+        self.position.clear()
+
+    def _remove_at(self, index):
+        heap = self.heap
+        entry = heap[index]
+        last = heap.pop()
+        del self.position[entry[2]]
+        if index < len(heap):
+            heap[index] = last
+            self.position[last[2]] = index
+            self._sift_up(index)
+            self._sift_down(self.position[last[2]])
+        return entry[2], entry[3]
+
+    def _sift_up(self, index):
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if not entry < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][2]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index):
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[index] = heap[child]
+            position[heap[index][2]] = index
+            index = child
+        heap[index] = entry
+        position[entry[2]] = index
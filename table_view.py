@@ -0,0 +1,106 @@
+from collections import deque
+
+
+class VirtualTable:
+    """Shared adapter that keeps a ttk.Treeview in step with a data structure.
+
+    Rows are (key, values) pairs, where key uniquely identifies a row and is
+    used as the Treeview item id. Only the first page of rows is inserted
+    when a source is loaded; further pages are pulled in as the user scrolls
+    towards the bottom. After loading, the owner keeps the table current with
+    append/remove/clear instead of rebuilding it.
+    """
+    def __init__(self, tree, page_size=200, scrollbar=None):
+        self.tree = tree
+        self.page_size = page_size
+        self.scrollbar = scrollbar
+        self.source = iter(())
+        self.source_done = True
+        self.pending = deque()  # Rows added while the source is still being paged
+        self.pending_keys = set()
+        self.skipped = set()  # Keys removed before their row was paged in
+        self.active = False  # Diffs are ignored until the table has been loaded
+        self.tree.configure(yscrollcommand=self._on_scroll)
+
+    def load(self, rows):
+        """Replace the table contents with a lazily paged iterable of rows."""
+        self.clear()
+        self.source = iter(rows)
+        self.source_done = False
+        self.active = True
+        self.load_more()
+
+    def load_more(self):
+        """Insert the next page of rows. Returns the number of rows inserted."""
+        inserted = 0
+        while inserted < self.page_size:
+            row = self._next_row()
+            if row is None:
+                break
+            key, values = row
+            if key in self.skipped:
+                self.skipped.discard(key)
+                continue
+            self.tree.insert("", "end", iid=str(key), values=values)
+            inserted += 1
+        return inserted
+
+    def _next_row(self):
+        if not self.source_done:
+            row = next(self.source, None)
+            if row is not None:
+                return row
+            self.source_done = True
+        if self.pending:
+            row = self.pending.popleft()
+            self.pending_keys.discard(row[0])
+            return row
+        return None
+
+    def _on_scroll(self, first, last):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        if float(last) >= 0.9:
+            self.load_more()
+
+    def append(self, key, values):
+        """Add a row after every row of the current source."""
+        if not self.active:
+            return
+        if self.source_done and not self.pending:
+            self.tree.insert("", "end", iid=str(key), values=values)
+        else:
+            self.pending.append((key, values))
+            self.pending_keys.add(key)
+
+    def remove(self, key):
+        if not self.active:
+            return
+        iid = str(key)
+        if self.tree.exists(iid):
+            self.tree.delete(iid)
+        else:
+            self.skipped.add(key)
+
+    def forget(self, key):
+        """Like remove, for a row the source has moved past and will not yield again.
+
+        Only a row still waiting among the appended ones is remembered as
+        skipped, so owners whose source steps over removed keys itself do
+        not grow `skipped` on every removal.
+        """
+        if not self.active:
+            return
+        iid = str(key)
+        if self.tree.exists(iid):
+            self.tree.delete(iid)
+        elif key in self.pending_keys:
+            self.skipped.add(key)
+
+    def clear(self):
+        self.tree.delete(*self.tree.get_children())
+        self.source = iter(())
+        self.source_done = True
+        self.pending.clear()
+        self.pending_keys.clear()
+        self.skipped.clear()
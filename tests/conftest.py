@@ -0,0 +1,49 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # The Topic scripts import the shared modules from the repo root
+
+
+def load_topic(number):
+    """Import "Topic N.py" (not importable by name because of the space) as a module."""
+    name = f"topic{number}"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, f"Topic {number}.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+@pytest.fixture(scope="session")
+def topic2():
+    return load_topic(2)
+
+
+@pytest.fixture(scope="session")
+def topic3():
+    return load_topic(3)
+
+
+@pytest.fixture(scope="session")
+def topic4():
+    return load_topic(4)
+
+
+@pytest.fixture(scope="session")
+def topic5():
+    return load_topic(5)
+
+
+@pytest.fixture(scope="session")
+def topic6():
+    return load_topic(6)
+
+
+@pytest.fixture(scope="session")
+def topic7():
+    return load_topic(7)
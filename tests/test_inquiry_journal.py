@@ -0,0 +1,175 @@
+import pytest
+
+
+def inquiry(name, priority=None):
+    result = {"name": name, "phone": "0781234567", "property": f"Flat of {name}"}
+    if priority is not None:
+        result["priority"] = priority
+    return result
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "inquiries.journal")
+
+
+def open_service(topic3, path, priority=False, compact_min=10_000):
+    service = topic3.InquiryService(journal=topic3.InquiryJournal(path, compact_min=compact_min), priority=priority)
+    service.recover()
+    return service
+
+
+def names(service):
+    return [item["name"] for item in service.inquiry_queue]
+
+
+def process(service):
+    taken = service.take_nowait()
+    service.task_done(taken)
+    return taken
+
+
+def test_fifo_recovery(topic3, path):
+    service = open_service(topic3, path)
+    service.submit_many([inquiry(name) for name in "ABCDE"])
+    assert process(service)["name"] == "A"
+    service.submit(inquiry("tab\tand\nnewline\\"))
+    service.shutdown()
+
+    recovered = open_service(topic3, path)
+    assert names(recovered) == ["B", "C", "D", "E", "tab\tand\nnewline\\"]
+    recovered.clear()
+    recovered.submit(inquiry("F"))
+    recovered.shutdown()
+    assert names(open_service(topic3, path)) == ["F"]
+
+
+def test_torn_tail_is_dropped(topic3, path):
+    service = open_service(topic3, path)
+    service.submit_many([inquiry("A"), inquiry("B")])
+    service.shutdown()
+    with open(path, "ab") as file:
+        file.write(b"E\tHalf")
+    recovered = open_service(topic3, path)
+    assert names(recovered) == ["A", "B"]
+    recovered.submit(inquiry("C"))
+    recovered.shutdown()
+    assert names(open_service(topic3, path)) == ["A", "B", "C"]
+
+
+def test_fifo_compaction(topic3, path):
+    service = open_service(topic3, path, compact_min=20)
+    service.submit_many([inquiry(str(number)) for number in range(30)])
+    for _ in range(25):
+        process(service)
+    assert service.journal.records < 55  # 30 enqueues + 25 processed, had it never compacted
+    service.submit(inquiry("late"))
+    service.shutdown()
+    assert names(open_service(topic3, path)) == ["25", "26", "27", "28", "29", "late"]
+
+
+def crash(service):
+    """Make the journal durable as it stands, then abandon the service without finishing anything."""
+    service.sync()
+
+
+@pytest.mark.parametrize("priority", [False, True])
+def test_inquiry_in_progress_during_a_crash_is_recovered(topic3, path, priority):
+    service = open_service(topic3, path, priority=priority)
+    service.submit_many([inquiry(name, 2 if priority else None) for name in "ABCD"])
+    first, second = service.take_nowait(), service.take_nowait()
+    service.task_done(second)  # Finished out of order while A is still being handled
+    crash(service)
+    recovered = names(open_service(topic3, path, priority=priority))
+    assert recovered == (["A", "C", "D"] if priority else ["A", "B", "C", "D"])
+
+    service = open_service(topic3, path, priority=priority)
+    service.task_done(service.take_nowait())
+    crash(service)
+    assert names(open_service(topic3, path, priority=priority)) == recovered[1:]
+
+
+@pytest.mark.parametrize("priority", [False, True])
+def test_unfinished_inquiries_survive_clear_and_compaction(topic3, path, priority):
+    service = open_service(topic3, path, priority=priority, compact_min=1)
+    service.submit_many([inquiry(name, 2 if priority else None) for name in "ABC"])
+    taken = service.take_nowait()
+    service.clear()
+    service.submit(inquiry("D", 2 if priority else None))
+    service.task_done(service.take_nowait())  # Finishing D compacts while A is unfinished
+    crash(service)
+    # In FIFO mode D is only logged as finished after A, the older take
+    assert names(open_service(topic3, path, priority=priority)) == (["A"] if priority else ["A", "D"])
+
+    service.task_done(taken)
+    crash(service)
+    assert names(open_service(topic3, path, priority=priority)) == []
+
+
+def test_failing_handler_does_not_stop_workers(topic3):
+    def handler(item):
+        if int(item["name"]) % 2:
+            raise ValueError("bad inquiry")
+
+    service = topic3.InquiryService(handler=handler, workers=2)
+    service.start()
+    service.submit_many([inquiry(str(number)) for number in range(10)])
+    service.shutdown(drain=True, timeout=5)
+    stats = service.stats()
+    assert stats["processed"] == 5
+    assert stats["failed"] == 5
+    assert stats["depth"] == 0
+
+
+def test_priority_recovery(topic3, path):
+    service = open_service(topic3, path, priority=True)
+    for name, level in (("A", 2), ("B", 2), ("C", 0), ("D", 3), ("E", 1)):
+        service.submit(inquiry(name, level))
+    ids = {item["name"]: item["id"] for item in service.inquiry_queue}
+    assert process(service)["name"] == "C"
+    service.cancel(ids["B"])
+    service.change_priority(ids["D"], 0)
+    expected = names(service)
+    service.shutdown()
+
+    recovered = open_service(topic3, path, priority=True)
+    assert names(recovered) == expected == ["D", "E", "A"]
+    assert {item["name"]: item["id"] for item in recovered.inquiry_queue} == {name: ids[name] for name in expected}
+
+
+def test_switch_from_fifo_to_priority_mode(topic3, path):
+    service = open_service(topic3, path)
+    service.submit_many([inquiry("a"), inquiry("b")])
+    service.shutdown()
+
+    priority = open_service(topic3, path, priority=True)
+    assert process(priority)["name"] == "a"
+    priority.shutdown()
+
+    recovered = open_service(topic3, path, priority=True)
+    assert [(item["name"], item["id"]) for item in recovered.inquiry_queue] == [("b", 2)]
+
+
+def test_fields_ending_in_r_or_u_use_the_fast_path(topic3, path, monkeypatch):
+    service = open_service(topic3, path)
+    service.submit_many([inquiry("PETER"), inquiry("LOU")])
+    service.shutdown()
+    journal = topic3.InquiryJournal(path)
+    monkeypatch.setattr(journal, "_replay", lambda lines: pytest.fail("replayed a FIFO-only log"))
+    assert [item["name"] for item in journal.recover()] == ["PETER", "LOU"]
+
+
+def test_priority_compaction_keeps_fifo_among_equals(topic3, path):
+    service = open_service(topic3, path, priority=True, compact_min=1)
+    service.submit(inquiry("B", 2))
+    service.submit(inquiry("A", 1))
+    for _ in range(3):
+        service.submit(inquiry("Z", 0))
+        process(service)  # Triggers compaction while B is queued behind A
+    with open(path, "rb") as file:
+        assert b"\nR\t" not in b"\n" + file.read()
+    b_id = next(item["id"] for item in service.inquiry_queue if item["name"] == "B")
+    service.change_priority(b_id, 1)
+    assert names(service) == ["B", "A"]
+    service.shutdown()
+    assert names(open_service(topic3, path, priority=True)) == ["B", "A"]
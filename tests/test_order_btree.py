@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from order_btree import OrderBTree
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "orders.btree")
+
+
+def fill(tree, count, seed=1, prices=500):
+    """Insert random orders (enough to split leaves and internal pages); returns their sorted keys."""
+    rng = random.Random(seed)
+    keys = []
+    for order_id in range(count):
+        price = rng.randrange(prices)
+        tree.insert(order_id, f"Client {order_id}", f"078{order_id:07d}", "détails " * (order_id % 4), price)
+        keys.append((price, order_id))
+    return sorted(keys)
+
+
+def test_reopen_keeps_orders_and_text(path):
+    with OrderBTree(path, cache_pages=8) as tree:
+        keys = fill(tree, 20_000)
+    with OrderBTree(path, cache_pages=8) as tree:
+        assert len(tree) == 20_000
+        orders = list(tree.iter_orders())
+        assert [(order.price, order.order_id) for order in orders] == keys
+        assert all(order.name == f"Client {order.order_id}" for order in orders)
+        assert all(order.property_details == "détails " * (order.order_id % 4) for order in orders)
+
+
+def test_inserts_after_reopen(path):
+    with OrderBTree(path) as tree:
+        fill(tree, 3000, seed=2)
+    with OrderBTree(path) as tree:
+        tree.insert(10**6, "Late", "0790000000", "Villa", -1)
+    with OrderBTree(path) as tree:
+        assert len(tree) == 3001
+        assert tree.kth_smallest(1).name == "Late"
+
+
+def test_range_queries_match_sorted_keys(path):
+    with OrderBTree(path, cache_pages=16) as tree:
+        keys = fill(tree, 10_000, seed=3)
+        rng = random.Random(4)
+        for _ in range(100):
+            low = rng.randrange(-10, 510)
+            high = low + rng.randrange(60)
+            in_range = [key for key in keys if low <= key[0] <= high]
+            assert [(order.price, order.order_id) for order in tree.range_orders(low, high)] == in_range
+            assert tree.count_range(low, high) == len(in_range)
+            assert tree.sum_range(low, high) == sum(price for price, _ in in_range)
+        for k in (1, 777, 10_000):
+            assert tree.kth_smallest(k).order_id == keys[k - 1][1]
+        assert tree.kth_smallest(10_001) is None
+        assert tree.median() == (keys[4999][0] + keys[5000][0]) / 2
+
+
+def test_paging_with_after(path):
+    with OrderBTree(path) as tree:
+        keys = fill(tree, 5000, seed=5)
+        seen = []
+        last = None
+        while True:
+            page = tree.page(333, after=last)
+            if not page:
+                break
+            seen += [(order.price, order.order_id) for order in page]
+            last = page[-1]
+        assert seen == keys
+
+
+def test_rejects_other_files(path):
+    with open(path, "wb") as file:
+        file.write(b"not a tree".ljust(4096, b"\0"))
+    with pytest.raises(ValueError):
+        OrderBTree(path)
@@ -0,0 +1,158 @@
+import random
+
+import pytest
+
+
+def check_avl(tree):
+    """Assert the AVL, size and total invariants everywhere; returns the nodes in order."""
+    def walk(node):
+        if node is None:
+            return 0, 0, 0
+        left_height, left_size, left_total = walk(node.left)
+        right_height, right_size, right_total = walk(node.right)
+        assert abs(left_height - right_height) <= 1
+        assert node.height == 1 + max(left_height, right_height)
+        assert node.size == 1 + left_size + right_size
+        assert node.total == node.price + left_total + right_total
+        return node.height, node.size, node.total
+
+    walk(tree.root)
+    nodes = list(tree.iter_nodes())
+    assert len(nodes) == len(tree) == len(tree.by_id)
+    assert [(node.price, node.sequence) for node in nodes] == sorted((node.price, node.sequence) for node in nodes)
+    return nodes
+
+
+def fill(tree, count, seed=1, prices=1000):
+    rng = random.Random(seed)
+    orders = []
+    for order_id in range(count):
+        order = (order_id, f"Client {order_id}", f"078{rng.randrange(50):07d}", "Flat", rng.randrange(prices))
+        tree.insert(*order)
+        orders.append(order)
+    return orders
+
+
+def test_sorted_inserts_stay_balanced(topic4):
+    tree = topic4.AVLTree()
+    for order_id in range(4096):
+        tree.insert(order_id, "Client", "0780000000", "Flat", order_id)
+    check_avl(tree)
+    assert tree.root.height <= 13
+
+
+def test_random_deletes_keep_invariants(topic4):
+    tree = topic4.AVLTree()
+    orders = fill(tree, 2000)
+    live = {order[0]: order for order in orders}
+    rng = random.Random(2)
+    for step in range(1500):
+        order_id = rng.choice(list(live))
+        order = live.pop(order_id)
+        if step % 3 == 0:
+            removed = tree.delete_by_id(order_id)
+        else:
+            removed = tree.delete(order[4], order_id)
+        assert removed.order_id == order_id
+        if step % 100 == 0:
+            check_avl(tree)
+    nodes = check_avl(tree)
+    assert sorted(node.order_id for node in nodes) == sorted(live)
+    assert tree.delete(10**9) is None
+    assert tree.delete_by_id(-1) is None
+
+
+def test_delete_by_price_removes_earliest_arrival(topic4):
+    tree = topic4.AVLTree()
+    for order_id in range(5):
+        tree.insert(order_id, "Client", "0780000000", "Flat", 100)
+    assert tree.delete(100).order_id == 0
+    assert tree.search(100).order_id == 1
+
+
+def test_indexes_follow_deletes(topic4):
+    tree = topic4.AVLTree()
+    tree.insert(1, "Ann", "0781111111", "Flat", 10)
+    tree.insert(2, "Ann", "0781111111", "House", 20)
+    tree.insert(3, "Bob", "0792222222", "Villa", 30)
+    assert [node.order_id for node in tree.find_by_phone("0781111111")] == [1, 2]
+    tree.delete_by_id(1)
+    assert tree.get(1) is None
+    assert [node.order_id for node in tree.find_by_phone("0781111111")] == [2]
+    with pytest.raises(ValueError):
+        tree.insert(3, "Bob", "0792222222", "Villa", 40)
+
+
+def test_order_statistics_match_sorted_prices(topic4):
+    tree = topic4.AVLTree()
+    orders = fill(tree, 1500, seed=3, prices=200)
+    prices = sorted(order[4] for order in orders)
+    rng = random.Random(4)
+    for _ in range(200):
+        low = rng.randrange(-10, 210)
+        high = low + rng.randrange(-5, 60)
+        in_range = [price for price in prices if low <= price <= high]
+        assert tree.count_range(low, high) == len(in_range)
+        assert tree.sum_range(low, high) == sum(in_range)
+        assert [node.price for node in tree.range_orders(low, high)] == in_range
+    for k in (1, 2, 750, 1500):
+        assert tree.kth_smallest(k).price == prices[k - 1]
+    assert tree.kth_smallest(0) is None
+    assert tree.kth_smallest(1501) is None
+    assert tree.median() == (prices[749] + prices[750]) / 2
+    assert tree.percentile(100) == prices[-1]
+    assert [node.price for node in tree.cheapest(5)] == prices[:5]
+
+
+def test_median_of_zero_prices(topic4):
+    tree = topic4.AVLTree()
+    assert tree.median() is None
+    tree.insert(1, "Client", "0780000000", "Flat", 0)
+    assert tree.median() == 0
+
+
+def test_paging_resumes_after_removed_order(topic4):
+    tree = topic4.AVLTree()
+    fill(tree, 500, seed=6, prices=40)
+    expected = [node.order_id for node in tree.iter_nodes()]
+    seen = []
+    last = None
+    while True:
+        page = tree.page(37, after=last)
+        if not page:
+            break
+        seen += [node.order_id for node in page]
+        last = page[-1]
+        if len(seen) == 37:
+            tree.delete_node(last)  # Paging must not depend on the last row still being there
+    assert seen == expected
+
+
+def test_bulk_load_merges_like_inserts(topic4):
+    rng = random.Random(5)
+    first = [(order_id, "Client", "0780000000", "Flat", rng.randrange(50)) for order_id in range(300)]
+    second = [(order_id, "Client", "0780000000", "Flat", rng.randrange(50)) for order_id in range(300, 700)]
+
+    inserted = topic4.AVLTree()
+    for order in first + second:
+        inserted.insert(*order)
+    loaded = topic4.AVLTree()
+    loaded.bulk_load(first)
+    assert loaded.bulk_load(second) == len(second)
+
+    check_avl(loaded)
+    assert list(loaded.iter_orders()) == list(inserted.iter_orders())
+    with pytest.raises(ValueError):
+        loaded.bulk_load([(1, "Client", "0780000000", "Flat", 1)])
+
+
+def test_columnar_tree_matches_binary_tree(topic4):
+    rng = random.Random(7)
+    orders = [(order_id, f"Client {order_id % 7}", "0780000000", "Flat", rng.randrange(100)) for order_id in range(3000)]
+    columnar = topic4.ColumnarOrderTree()
+    plain = topic4.BinaryTree()
+    for order in orders:
+        columnar.insert(*order)
+        plain.insert(*order)
+    assert list(columnar.iter_orders()) == list(plain.iter_orders())
+    assert list(columnar.iter_orders(start_price=50)) == list(plain.iter_orders(start_price=50))
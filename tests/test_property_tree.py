@@ -0,0 +1,182 @@
+import os
+import random
+from collections import Counter
+
+import pytest
+
+
+CATEGORIES = ("Luxury", "Standard", "Economy")
+SIZES = ("Small", "Medium", "Large")
+
+
+def build_tree(topic7, count, seed=1):
+    """A random hierarchy of category branches with properties under them."""
+    rng = random.Random(seed)
+    tree = topic7.BinaryTree()
+    tree.add_node(topic7.TreeNode("Properties", "N/A", "N/A", 0, 4))
+    nodes = [tree.root]
+    for number in range(count):
+        if rng.random() < 0.1:
+            node = topic7.TreeNode(f"Branch {number}", "N/A", "N/A", 0, 4)
+        else:
+            node = topic7.TreeNode(f"Property {number}", rng.choice(CATEGORIES), rng.choice(SIZES),
+                                   rng.randrange(10**6), rng.randint(1, 3))
+        tree.add_child(rng.choice(nodes), node)
+        nodes.append(node)
+    return tree, nodes
+
+
+def walk(root):
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+
+def outline(tree, *fields):
+    """(depth, path, fields...) for every node in pre-order, to compare whole trees."""
+    rows = []
+    stack = [(tree.root, 0)] if tree.root is not None else []
+    while stack:
+        node, depth = stack.pop()
+        rows.append((depth, node.path) + tuple(getattr(node, field) for field in fields))
+        stack.extend((child, depth + 1) for child in reversed(node.children))
+    return rows
+
+
+def test_find_node_by_name_and_path(topic7):
+    tree, nodes = build_tree(topic7, 500, seed=3)
+    for node in nodes[::25]:
+        assert tree.find_node(node.path) is node
+        assert tree.find_node(node.name) is node  # build_tree gives every node its own name
+    assert tree.find_node("No such property") is None
+
+
+def test_rollups_add_up(topic7):
+    tree, _ = build_tree(topic7, 2000, seed=3)
+    for node in walk(tree.root):
+        subtree = list(walk(node))
+        assert node.count == len(subtree)
+        assert node.total_value == sum(item.value for item in subtree)
+        assert node.category_counts == Counter(item.category for item in subtree)
+        assert node.size_counts == Counter(item.size for item in subtree)
+    assert tree.rollup("Properties")["count"] == 2001
+    assert tree.rollup("No such property") is None
+
+
+def test_children_stay_sorted(topic7):
+    tree, nodes = build_tree(topic7, 2000, seed=3)
+    with tree.deferred_sorting():
+        for number in range(200):
+            tree.add_child(nodes[number], topic7.TreeNode(f"Late {number}", "Luxury", "Large", number, 1))
+    for node in walk(tree.root):
+        keys = [child.sort_key for child in node.children]
+        assert keys == sorted(keys)
+    assert tree.root.count == 2201
+
+
+def test_best_key_covers_subtree(topic7):
+    tree, _ = build_tree(topic7, 2000, seed=3)
+    tree.set_sort_fields(("category", "value"))
+    for node in walk(tree.root):
+        assert node.best == min(item.sort_key for item in walk(node))
+
+
+@pytest.mark.parametrize("fields", [("size", "value"), ("value",), ("category", "size", "value")])
+def test_top_k_matches_full_sort(topic7, fields):
+    tree, nodes = build_tree(topic7, 3000, seed=2)
+    tree.set_sort_fields(fields)
+    expected = sorted(node.sort_key for node in nodes)
+    for k in (1, 20, 500, len(nodes), len(nodes) + 5):
+        assert [node.sort_key for node in tree.top_k(k)] == expected[:k]
+    assert tree.top_k(0) == []
+
+
+def test_snapshot_round_trip_with_appends(topic7, tmp_path):
+    path = str(tmp_path / "properties.snapshot")
+    tree, nodes = build_tree(topic7, 2000, seed=4)
+    tree.save_changes(path)  # Nothing saved yet, so this writes a full snapshot
+    rng = random.Random(5)
+    for round_number in range(3):
+        for number in range(100):
+            node = topic7.TreeNode(f"New {round_number}.{number}", "Standard", "Small", rng.randrange(100), 2)
+            tree.add_child(rng.choice(nodes), node)
+            nodes.append(node)
+        tree.save_changes(path)
+    fields = ("name", "category", "size", "value", "priority", "sort_key", "best", "count", "total_value")
+
+    loaded = topic7.BinaryTree.load(path)
+    assert outline(loaded, *fields) == outline(tree, *fields)
+    assert set(loaded.by_path) == set(tree.by_path)
+    assert [node.sort_key for node in loaded.top_k(50)] == [node.sort_key for node in tree.top_k(50)]
+
+    # A loaded tree keeps appending where the file left off
+    loaded.add_child(loaded.find_node("New 0.0"), topic7.TreeNode("After load", "Luxury", "Large", 1, 1))
+    loaded.save_changes(path)
+    assert outline(topic7.BinaryTree.load(path), *fields) == outline(loaded, *fields)
+
+
+def test_torn_append_is_truncated(topic7, tmp_path):
+    path = str(tmp_path / "properties.snapshot")
+    tree, _ = build_tree(topic7, 100, seed=6)
+    tree.save(path)
+    size = os.path.getsize(path)
+    with open(path, "ab") as file:
+        file.write(b"\x01\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00abc")
+    assert outline(topic7.BinaryTree.load(path), "name") == outline(tree, "name")
+    assert os.path.getsize(path) == size
+
+
+def test_apps_use_separate_snapshot_files(topic6, topic7, tmp_path):
+    assert topic6.SNAPSHOT_PATH != topic7.SNAPSHOT_PATH
+    path = str(tmp_path / "properties.snapshot")
+    tree, _ = build_tree(topic7, 10)
+    tree.save(path)
+    with pytest.raises(ValueError):
+        topic6.BinaryTree.load(path)
+
+
+def test_failed_save_keeps_previous_snapshot(topic6, tmp_path):
+    path = str(tmp_path / "properties.snapshot")
+    tree = topic6.BinaryTree()
+    tree.add_node(topic6.TreeNode("Properties", "N/A"))
+    tree.add_child(tree.root, topic6.TreeNode("Villa", "Luxury"))
+    tree.save(path)
+    before = open(path, "rb").read()
+
+    tree.add_child(tree.root, topic6.TreeNode("Bad\0name", "Luxury"))
+    with pytest.raises(ValueError):
+        tree.save(path)
+    assert open(path, "rb").read() == before
+    assert os.listdir(tmp_path) == ["properties.snapshot"]
+
+
+def test_topic6_snapshot_round_trip(topic6, tmp_path):
+    path = str(tmp_path / "properties.snapshot")
+    rng = random.Random(7)
+    tree = topic6.BinaryTree()
+    tree.add_node(topic6.TreeNode("Properties", "N/A"))
+    nodes = [tree.root]
+    for number in range(1000):
+        node = topic6.TreeNode(f"Property {number} é", rng.choice(CATEGORIES))
+        tree.add_child(rng.choice(nodes), node)
+        nodes.append(node)
+        if number in (400, 999):
+            tree.save_changes(path)
+    loaded = topic6.BinaryTree.load(path)
+    assert outline(loaded, "name", "category") == outline(tree, "name", "category")
+    assert loaded.find_node("Property 500 é").path == tree.find_node("Property 500 é").path
+
+
+def test_columns_filters(topic7):
+    pytest.importorskip("numpy")
+    tree, nodes = build_tree(topic7, 2000, seed=8)
+    columns = tree.columns()
+    rng = random.Random(9)
+    for _ in range(50):
+        under = rng.choice(nodes)
+        category = rng.choice(CATEGORIES)
+        expected = [node for node in walk(under) if node.category == category and node.value >= 500_000]
+        assert columns.filter(category=category, min_value=500_000, under=under) == expected
+        assert columns.count_by_category(under=under)[category] == sum(node.category == category for node in walk(under))
@@ -0,0 +1,114 @@
+import random
+from collections import OrderedDict
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def order_ids(orders):
+    return [order["order_id"] for order in orders.to_list()]
+
+
+def test_lru_matches_ordered_dict(topic5):
+    rng = random.Random(1)
+    for limit in (1, 2, 5, 50):
+        orders = topic5.CircularLinkedList(limit)
+        expected = OrderedDict()
+        for order_id in range(3000):
+            action = rng.random()
+            if action < 0.5 or not expected:
+                orders.insert(order_id, "Client", "0780000000", "Flat", order_id)
+                if len(expected) >= limit:
+                    expected.popitem(last=False)
+                expected[order_id] = True
+            elif action < 0.7:
+                victim = rng.choice(list(expected))
+                assert orders.remove_by_id(victim)
+                del expected[victim]
+            elif action < 0.9:
+                touched = rng.choice(list(expected))
+                assert orders.move_to_front(touched)
+                expected.move_to_end(touched)
+            else:
+                orders.remove_front()
+                expected.popitem(last=False)
+            assert order_ids(orders) == list(expected)
+            assert len(orders) == len(expected)
+        assert not orders.remove_by_id(-1)
+        assert not orders.move_to_front(-1)
+
+
+def test_window_aggregates_match_reference(topic5):
+    rng = random.Random(2)
+    clock = FakeClock()
+    orders = topic5.CircularLinkedList(limit=40, max_age=10, clock=clock)
+    expected = OrderedDict()  # order_id -> (price, time added or touched)
+    for order_id in range(5000):
+        clock.now += rng.random()
+        for stale in [key for key, (_, added) in expected.items() if added <= clock.now - 10]:
+            del expected[stale]
+        action = rng.random()
+        if action < 0.6 or not expected:
+            price = rng.randrange(-50, 1000)
+            orders.insert(order_id, "Client", "0780000000", "Flat", price)
+            if len(expected) >= 40:
+                expected.popitem(last=False)
+            expected[order_id] = (price, clock.now)
+        elif action < 0.8:
+            victim = rng.choice(list(expected))
+            orders.remove_by_id(victim)
+            del expected[victim]
+        else:
+            touched = rng.choice(list(expected))
+            orders.move_to_front(touched)
+            expected[touched] = (expected[touched][0], clock.now)
+            expected.move_to_end(touched)
+        prices = [price for price, _ in expected.values()]
+        stats = orders.stats()
+        assert stats["count"] == len(prices)
+        assert stats["total"] == sum(prices)
+        assert stats["min"] == (min(prices) if prices else None)
+        assert stats["max"] == (max(prices) if prices else None)
+        assert order_ids(orders) == list(expected)
+
+
+def test_removal_behind_a_smaller_price_restores_the_minimum(topic5):
+    orders = topic5.CircularLinkedList(limit=10)
+    orders.insert(1, "Client", "0780000000", "Flat", 5)
+    orders.insert(2, "Client", "0780000000", "Flat", 3)
+    orders.remove_by_id(2)
+    assert orders.min_price() == 5
+    assert orders.max_price() == 5
+
+
+def test_stale_heap_entries_stay_bounded(topic5):
+    orders = topic5.CircularLinkedList(limit=10**9)
+    for order_id in range(20_000):
+        orders.insert(order_id, "Client", "0780000000", "Flat", order_id % 97)
+        if order_id >= 10:
+            orders.move_to_front(order_id - 5)
+            orders.remove_by_id(order_id - 10)
+    assert len(orders.min_heap) <= 2 * len(orders) + 17
+
+
+def test_events(topic5):
+    orders = topic5.CircularLinkedList(limit=2)
+    events = []
+    orders.subscribe(lambda event, node: events.append((event, node and node.order_id)))
+    orders.insert(1, "Client", "0780000000", "Flat", 10)
+    orders.insert(2, "Client", "0780000000", "Flat", 20)
+    orders.move_to_front(1)
+    orders.insert(3, "Client", "0780000000", "Flat", 30)
+    orders.remove_by_id(3)
+    orders.clear()
+    assert events == [
+        ("inserted", 1), ("inserted", 2),
+        ("removed", 1), ("inserted", 1),
+        ("evicted", 2), ("inserted", 3),
+        ("removed", 3), ("cleared", None),
+    ]
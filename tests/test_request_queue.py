@@ -0,0 +1,69 @@
+import csv
+from collections import deque
+
+import pytest
+
+
+def request(number):
+    return ("Client", f"078{number:07d}", f"Request {number}")
+
+
+@pytest.mark.parametrize("max_capacity", [None, 16])
+def test_ring_buffer_matches_deque(topic2, max_capacity):
+    queue = topic2.CircularRequestQueue(4, max_capacity, policy="overwrite")
+    expected = deque()
+    limit = max_capacity or 4
+    for number in range(200):
+        if number % 3 == 2:
+            assert queue.dequeue() == (expected.popleft() if expected else None)
+        else:
+            assert queue.enqueue(request(number))
+            if len(expected) == limit:
+                expected.popleft()
+            expected.append(request(number))
+        assert list(queue) == list(expected)
+    assert queue.capacity >= 4
+
+
+def test_reject_policy(topic2):
+    queue = topic2.CircularRequestQueue(2)
+    assert queue.enqueue_many(request(number) for number in range(5)) == 2
+    assert queue.is_full()
+
+
+@pytest.mark.parametrize("phone", ["abc", "123", "12345678901", "-5", "", 780000000])
+def test_bad_phone_leaves_the_ring_untouched(topic2, phone):
+    queue = topic2.CircularRequestQueue(2, policy="overwrite")
+    queue.enqueue(request(1))
+    queue.enqueue(request(2))
+    with pytest.raises(ValueError):
+        queue.enqueue(("Client", phone, "Request"))
+    assert list(queue) == [request(1), request(2)]
+    assert queue.dropped == 0
+
+
+def test_phone_round_trips_exactly(topic2):
+    queue = topic2.CircularRequestQueue(2)
+    queue.enqueue(("Client", "0012345678", "Request"))
+    assert queue.dequeue() == ("Client", "0012345678", "Request")
+
+
+def test_import_reports_rejected_rows_with_quoting(topic2, tmp_path):
+    source = tmp_path / "requests.csv"
+    with open(source, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["username", "phone", "request"])
+        for number in range(10):
+            writer.writerow(request(number)[:1] + ("0781234567", f"Flat, floor {number}"))
+        writer.writerow(['Bad "name", 1', "12", "x,y"])
+    queue = topic2.CircularRequestQueue(4, policy="overwrite")
+    report = topic2.import_requests_csv(str(source), queue)
+    assert report.accepted == 10
+    assert [item[2] for item in queue] == [f"Flat, floor {number}" for number in range(6, 10)]
+
+    errors = tmp_path / "errors.csv"
+    report.write_errors(str(errors))
+    with open(errors, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows[1][0] == "12"
+    assert next(csv.reader([rows[1][1]])) == ['Bad "name", 1', "12", "x,y"]
@@ -0,0 +1,49 @@
+from table_view import VirtualTable
+
+
+class FakeTreeview:
+    """Just enough of ttk.Treeview for VirtualTable, without a display."""
+    def __init__(self):
+        self.items = {}
+
+    def configure(self, **options):
+        pass
+
+    def insert(self, parent, index, iid, values):
+        self.items[iid] = values
+
+    def exists(self, iid):
+        return iid in self.items
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.items[iid]
+
+    def get_children(self):
+        return list(self.items)
+
+
+def test_removed_rows_are_skipped_when_paged_in():
+    table = VirtualTable(FakeTreeview(), page_size=10)
+    table.load((key, (key,)) for key in range(100))
+    table.remove(50)
+    table.remove(5)
+    while table.load_more():
+        pass
+    assert sorted(map(int, table.tree.items)) == [key for key in range(100) if key not in (5, 50)]
+    assert not table.skipped
+
+
+def test_forget_only_remembers_appended_rows():
+    table = VirtualTable(FakeTreeview(), page_size=10)
+    table.load((key, (key,)) for key in range(100))
+    table.append(100, (100,))
+    for key in range(30):
+        table.forget(key)  # Rows the source has moved past or will step over itself
+    table.forget(100)
+    assert table.skipped == {100}
+    assert "0" not in table.tree.items
+    while table.load_more():
+        pass
+    assert not table.skipped
+    assert "100" not in table.tree.items
@@ -0,0 +1,150 @@
+import gc
+import itertools
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from operator import attrgetter
+
+MAGIC = b"PTSNAP01"
+FILE_HEADER = struct.Struct("<8sI")  # magic, length of the layout description that follows
+SEGMENT = struct.Struct("<qII")  # serial of the node the subtree hangs under, node count, string table bytes
+NO_PARENT = -1
+
+
+@contextmanager
+def gc_paused():
+    """Pause cyclic GC, which otherwise rescans the whole tree while many small objects are made."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+class TreeSnapshot:
+    """Compact binary snapshots of a node hierarchy, shared by the property tree apps.
+
+    A file starts with a header describing the record layout, followed by
+    segments. Each segment is one subtree: the serial number of the node it
+    hangs under, a string table (NUL-separated UTF-8), and one fixed-width
+    record per node in pre-order holding string-table indexes for the text
+    fields, the numeric fields and the node's child count. The first
+    segment is the whole tree; incremental saves append one segment per new
+    subtree. Saved nodes are numbered in save order (`serial`), which is how
+    later segments name their parent.
+    """
+    def __init__(self, text_fields, number_fields=()):
+        self.text_fields = tuple(text_fields)
+        self.number_fields = tuple(name for name, _ in number_fields)
+        codes = "".join(code for _, code in number_fields)
+        self.record = struct.Struct("<" + "I" * len(self.text_fields) + codes + "I")
+        self.layout = f"{','.join(self.text_fields)};{','.join(self.number_fields)};{self.record.format}".encode()
+
+    def save(self, path, root):
+        """Atomically write a full snapshot; returns the nodes in serial order.
+
+        The snapshot goes to a temporary file that then replaces `path`, so
+        an interrupted save leaves the previous snapshot intact.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file, gc_paused():
+                file.write(FILE_HEADER.pack(MAGIC, len(self.layout)))
+                file.write(self.layout)
+                nodes = self._write_segment(file, NO_PARENT, root, 0) if root is not None else []
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return nodes
+
+    def append(self, path, roots, next_serial):
+        """Append one segment per new subtree, each under an already saved parent; returns the new nodes."""
+        saved = []
+        with open(path, "ab") as file, gc_paused():
+            for root in roots:
+                saved += self._write_segment(file, root.parent.serial, root, next_serial + len(saved))
+        return saved
+
+    def _write_segment(self, file, parent_serial, root, next_serial):
+        nodes = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node.serial = next_serial + len(nodes)
+            nodes.append(node)
+            stack.extend(reversed(node.children))
+
+        # Build whole columns at a time so the per-node work stays in C
+        texts = [list(map(attrgetter(field), nodes)) for field in self.text_fields]
+        strings = list(dict.fromkeys(itertools.chain.from_iterable(texts)))
+        index_of = {text: index for index, text in enumerate(strings)}
+        columns = [list(map(index_of.__getitem__, column)) for column in texts]
+        columns += [list(map(attrgetter(field), nodes)) for field in self.number_fields]
+        columns.append([len(node.children) for node in nodes])
+        table = "\0".join(strings)
+        if table.count("\0") != len(strings) - 1:
+            raise ValueError("Text fields cannot contain NUL characters")
+        table = table.encode("utf-8")
+        file.write(SEGMENT.pack(parent_serial, len(nodes), len(table)))
+        file.write(table)
+        file.write(b"".join(map(self.record.pack, *columns)))
+        return nodes
+
+    def load(self, path, make_node):
+        """Yield (parent serial, nodes in pre-order) for each segment, without recursion.
+
+        make_node is called with the text fields then the numeric fields.
+        Within a segment, children and parent links are already set; the
+        segment's first node is left for the caller to attach. A segment cut
+        short by an interrupted append ends the load and is truncated away.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < FILE_HEADER.size:
+            raise ValueError(f"{path} is not a snapshot of this kind of tree")
+        magic, layout_size = FILE_HEADER.unpack_from(data)
+        offset = FILE_HEADER.size + layout_size
+        if magic != MAGIC or data[FILE_HEADER.size:offset] != self.layout:
+            raise ValueError(f"{path} is not a snapshot of this kind of tree")
+        view = memoryview(data)
+        text_count = len(self.text_fields)
+        # The pause lasts until the caller has consumed every segment
+        with gc_paused():
+            while offset + SEGMENT.size <= len(data):
+                parent_serial, count, table_size = SEGMENT.unpack_from(data, offset)
+                start = offset + SEGMENT.size + table_size
+                end = start + count * self.record.size
+                if end > len(data) or not count:
+                    break
+                strings = data[offset + SEGMENT.size:start].decode("utf-8").split("\0")
+                offset = end
+
+                # Unpack column by column so the per-field work stays in C
+                columns = list(zip(*self.record.iter_unpack(view[start:end])))
+                texts = [list(map(strings.__getitem__, column)) for column in columns[:text_count]]
+                nodes = list(map(make_node, *texts, *columns[text_count:-1]))
+
+                open_parents = []  # [node, children still to read] for nodes whose children are pending
+                for node, child_count in zip(nodes, columns[-1]):
+                    if open_parents:
+                        pending = open_parents[-1]
+                        pending[0].children.append(node)
+                        node.parent = pending[0]
+                        pending[1] -= 1
+                        if not pending[1]:
+                            open_parents.pop()
+                    if child_count:
+                        open_parents.append([node, child_count])
+                yield parent_serial, nodes
+
+        if offset < len(data):
+            # Drop the torn segment so the next append starts on a segment boundary
+            with open(path, "r+b") as file:
+                file.truncate(offset)